@@ -5,6 +5,7 @@ Run this locally to see what data is being processed.
 """
 
 import json
+import sys
 from pathlib import Path
 import os
 from datetime import datetime
@@ -79,7 +80,7 @@ def test_latest_detection():
     print(f"   Modified: {mtime}")
     
     # Test combined approach
-    print("\n3. BY FOLDER+TIME (current logic):")
+    print("\n3. BY FOLDER+TIME (previous logic):")
     def sort_key(file_path):
         folder_name = file_path.parent.parent.name
         file_mtime = file_path.stat().st_mtime
@@ -91,6 +92,18 @@ def test_latest_detection():
     print(f"   Folder: {by_combined.parent.parent.name}")
     print(f"   Modified: {combined_mtime}")
 
+    # Test run manifest (what update_sheet.py uses)
+    print("\n4. BY RUN MANIFEST (runs/manifest.sqlite):")
+    sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+    import run_manifest
+    entry = run_manifest.latest()
+    if entry is None:
+        print("   ❌ Manifest empty, run: python3 scripts/run_manifest.py rebuild")
+    else:
+        print(f"   Winner: {entry['result_path']}")
+        print(f"   Folder: {entry['run_folder']}")
+        print(f"   Written: {datetime.fromtimestamp(entry['written_at'])}")
+
 def check_last_result_marker():
     """Check what the .last_result marker contains."""
     print("\n" + "=" * 80)
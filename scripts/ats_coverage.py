@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
-import sys, re, pathlib, json
+import sys, pathlib, json, csv, argparse
+from collections import Counter
 
-STOP = set("""a an the and or but if to of in for on at as by from with is are was were be been being this that those these it its into within over under between across per""".split())
+import docx_text
+import text_norm
+
+TARGET_CAP = 200
+
+STOP = frozenset("""a an the and or but if to of in for on at as by from with is are was were be been being this that those these it its into within over under between across per""".split())
 
 def tokenize(text):
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9\s\-]+", " ", text)
-    toks = [t for t in text.split() if t and t not in STOP]
-    return toks
+    return text_norm.tokens(text, STOP)
+
+def read_text(path):
+    """Text of a markdown or .docx resume."""
+    if docx_text.is_docx(path):
+        return docx_text.extract_text(path)
+    return pathlib.Path(path).read_text(encoding="utf-8")
+
+def tokenize_file(path):
+    """tokenize() for large files, streamed in chunks. .docx files are streamed paragraph by paragraph."""
+    chunks = docx_text.iter_chunks(path) if docx_text.is_docx(path) else text_norm.read_chunks(path)
+    return list(text_norm.iter_tokens(chunks, STOP))
 
 def ngrams(tokens, n=2):
     return [" ".join(tokens[i:i+n]) for i in range(len(tokens)-n+1)]
@@ -19,22 +33,133 @@ def extract_terms(jd_text):
     uni = {t for t in uni if len(t) > 2}
     return uni, bi
 
-def coverage(jd_uni, jd_bi, resume_text):
+def term_weights(jd_text, index=None):
+    """JD term -> weight: tf * idf against a jd_corpus.DocFreqIndex, or 1.0 per term without one."""
+    if index is None or index.n_docs == 0:
+        uni, bi = extract_terms(jd_text)
+        return dict.fromkeys(uni | bi, 1.0)
+    toks = tokenize(jd_text)
+    tf = Counter(t for t in toks if len(t) > 2)
+    tf.update(ngrams(toks, 2))
+    return {t: n * index.idf(t) for t, n in tf.items()}
+
+def select_target(jd_text, index=None, cap=TARGET_CAP):
+    """JD terms to score, most important first.
+
+    With a jd_corpus.DocFreqIndex, terms are ranked by TF-IDF against every JD in runs/;
+    without one, the first cap terms alphabetically, as before.
+    """
+    weights = term_weights(jd_text, index)
+    if index is None or index.n_docs == 0:
+        return sorted(weights)[:cap]
+    return sorted(weights, key=lambda t: (-weights[t], t))[:cap]
+
+def coverage(jd_uni, jd_bi, resume_text, target=None):
     toks = tokenize(resume_text)
     uni = set(toks)
     bi = set(ngrams(toks, 2))
-    must = jd_uni | jd_bi
-    target = list(sorted(must))[:200]
+    if target is None:
+        target = sorted(jd_uni | jd_bi)[:TARGET_CAP]
     present = [t for t in target if (t in uni) or (t in bi)]
     pct = round(100.0 * len(present) / max(1, len(target)), 1)
     missing = [t for t in target if t not in present]
     return pct, present, missing
 
-def main(jd_path, resume_path):
+class TermIndex:
+    """Shared unigram + bigram vocabulary. Documents are stored as int bitsets over term ids."""
+
+    def __init__(self):
+        self.ids = {}
+        self.terms = []
+
+    def vector(self, terms, grow=False):
+        bits = 0
+        for t in terms:
+            i = self.ids.get(t)
+            if i is None:
+                if not grow:
+                    continue
+                i = self.ids[t] = len(self.terms)
+                self.terms.append(t)
+            bits |= 1 << i
+        return bits
+
+    def decode(self, bits):
+        out = []
+        while bits:
+            low = bits & -bits
+            out.append(self.terms[low.bit_length() - 1])
+            bits ^= low
+        return sorted(out)
+
+def discover(runs_dir):
+    """All run JDs and resume variants under runs/, skipping the template folder."""
+    runs_dir = pathlib.Path(runs_dir)
+    runs = [r for r in sorted(runs_dir.iterdir()) if r.is_dir() and not r.name.startswith("_")]
+    jds = [p for r in runs for p in sorted((r / "inputs").glob("*.md")) if p.name.lower() == "jd.md"]
+    resumes = [p for r in runs for p in sorted((r / "outputs").iterdir())
+               if p.suffix.lower() in (".md", ".docx") and "resume" in p.name.lower() and not p.name.startswith("~$")]
+    return jds, resumes
+
+def batch_coverage(jd_paths, resume_paths, df_index=None):
+    """Score every resume against every JD in one pass over a shared term index."""
+    index = TermIndex()
+    ranked, targets = [], []
+    for p in jd_paths:
+        terms = select_target(pathlib.Path(p).read_text(encoding="utf-8"), df_index)
+        ranked.append(terms)
+        targets.append(index.vector(terms, grow=True))
+    vectors = []
+    for p in resume_paths:
+        try:
+            toks = tokenize_file(p)
+        except ValueError as e:
+            print(f"[WARN] Skipping {e}", file=sys.stderr)
+            toks = []
+        vectors.append(index.vector(set(toks) | set(ngrams(toks, 2))))
+
+    matrix, pairs = [], []
+    for jd, terms, target in zip(jd_paths, ranked, targets):
+        total = max(1, target.bit_count())
+        row = []
+        for res, vec in zip(resume_paths, vectors):
+            pct = round(100.0 * (target & vec).bit_count() / total, 1)
+            row.append(pct)
+            pairs.append({
+                "jd": str(jd),
+                "resume": str(res),
+                "coverage_percent": pct,
+                "missing_terms": [t for t in terms if not vec >> index.ids[t] & 1][:50],
+            })
+        matrix.append(row)
+    return {
+        "jds": [str(p) for p in jd_paths],
+        "resumes": [str(p) for p in resume_paths],
+        "terms": len(index.terms),
+        "matrix": matrix,
+        "pairs": pairs,
+    }
+
+def write_batch(report, fmt, out):
+    fh = open(out, "w", encoding="utf-8", newline="") if out else sys.stdout
+    try:
+        if fmt == "csv":
+            w = csv.writer(fh)
+            w.writerow(["jd", "resume", "coverage_percent", "missing_terms"])
+            for p in report["pairs"]:
+                w.writerow([p["jd"], p["resume"], p["coverage_percent"], "; ".join(p["missing_terms"])])
+        else:
+            json.dump(report, fh, indent=2)
+            fh.write("\n")
+    finally:
+        if out:
+            fh.close()
+
+def main(jd_path, resume_path, df_index=None):
     jd = pathlib.Path(jd_path).read_text(encoding="utf-8")
-    res = pathlib.Path(resume_path).read_text(encoding="utf-8")
+    res = read_text(resume_path)
     jd_uni, jd_bi = extract_terms(jd)
-    pct, present, missing = coverage(jd_uni, jd_bi, res)
+    pct, present, missing = coverage(jd_uni, jd_bi, res, select_target(jd, df_index))
     report = {
         "coverage_percent": pct,
         "present_terms": present[:50],
@@ -43,7 +168,25 @@ def main(jd_path, resume_path):
     print(json.dumps(report, indent=2))
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: ats_coverage.py <JD.md> <resume.md>")
+    ap = argparse.ArgumentParser(description="ATS unigram and bigram coverage of resumes against JDs")
+    ap.add_argument("jd", nargs="?", help="JD markdown file")
+    ap.add_argument("resume", nargs="?", help="Resume markdown or .docx file")
+    ap.add_argument("--batch", action="store_true", help="Score every resume in runs/*/outputs against every JD in runs/*/inputs")
+    ap.add_argument("--runs", default="runs", help="Runs folder for --batch, defaults to runs")
+    ap.add_argument("--format", choices=["json", "csv"], default="json", help="Batch output format")
+    ap.add_argument("--out", help="Write batch output to this file instead of stdout")
+    ap.add_argument("--rank", choices=["tfidf", "alpha"], default="tfidf",
+                    help="Pick the scored JD terms by TF-IDF over runs/ JDs (default) or alphabetically")
+    args = ap.parse_args()
+    df_index = None
+    if args.rank == "tfidf":
+        from jd_corpus import load_corpus_index
+        df_index = load_corpus_index(args.runs)
+    if args.batch:
+        jds, resumes = discover(args.runs)
+        write_batch(batch_coverage(jds, resumes, df_index), args.format, args.out)
+    elif not (args.jd and args.resume):
+        print("Usage: ats_coverage.py <JD.md> <resume.md>  |  ats_coverage.py --batch [--format csv] [--out FILE]")
         sys.exit(2)
-    main(sys.argv[1], sys.argv[2])
+    else:
+        main(args.jd, args.resume, df_index)
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
-import re
+import text_norm
+from skill_matcher import load_matcher
 
 def tokenize(text: str):
-    return re.findall(r"\b\w+\b", text.lower())
+    return text_norm.tokens(text)
 
 def compute_ats_score(jd_text: str, skills_file: str) -> float:
-    with open(skills_file, "r", encoding="utf-8") as f:
-        skills = [line.strip().lower() for line in f if line.strip()]
-    jd_tokens = set(tokenize(jd_text))
-    matched = [s for s in skills if s in jd_tokens]
-    return round(len(matched) / len(skills) * 100, 2) if skills else 0.0
+    """Percent of the skills in skills_file found in the JD, multi-word skills and spelling variants included."""
+    return load_matcher(skills_file).score(jd_text)
+
+def compute_ats_scores(jd_texts, skills_file: str) -> list:
+    """compute_ats_score() for many JDs against one compiled skill set."""
+    return load_matcher(skills_file).score_many(jd_texts)
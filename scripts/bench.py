@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the scoring, generation, rendering and Sheets paths.
+Synthetic JD and resume corpora grow through SIZES; each case reports throughput, latency
+percentiles and peak traced memory. Results can be saved as a baseline and later runs
+compared against it.
+
+    python3 scripts/bench.py --save          # record benchmarks/baseline.json
+    python3 scripts/bench.py --compare       # fail if any p50 regresses past --threshold
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE_PATH = ROOT / "benchmarks" / "baseline.json"
+SIZES = {"small": 200, "medium": 2000, "large": 20000}  # words per synthetic JD
+FILLER = """analyst data team business stakeholders reporting insights dashboards models quality
+delivery drive improve build partner support manage strategy growth customers operations
+process cost revenue accuracy forecasting planning metrics teams leaders product tools""".split()
+
+
+def synthetic_text(words: int, seed: int) -> str:
+    """Skills-heavy pseudo JD or resume text, deterministic for a given seed."""
+    rng = random.Random(seed)
+    skills = (ROOT / "data" / "skills.txt").read_text(encoding="utf-8").split("\n")
+    vocab = [s for s in skills if s] + FILLER * 3
+    lines, line = [], []
+    for i in range(words):
+        line.append(rng.choice(vocab))
+        if len(line) >= 12:
+            lines.append("- " + " ".join(line) + ".")
+            line = []
+    lines.append(" ".join(line))
+    return "\n".join(lines)
+
+
+def measure(fn, repeat: int) -> dict:
+    fn()  # warm up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    samples.sort()
+    q = statistics.quantiles(samples, n=100, method="inclusive") if len(samples) > 1 else samples * 99
+    return {
+        "runs": repeat,
+        "ops_per_sec": round(1000 * repeat / max(sum(samples), 1e-9), 2),
+        "p50_ms": round(q[49], 3),
+        "p95_ms": round(q[94], 3),
+        "p99_ms": round(q[98], 3),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+@contextmanager
+def scratch_dir():
+    """Run inside a temp dir so generated runs and manifests never touch the repo."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            yield Path(tmp)
+        finally:
+            os.chdir(cwd)
+
+
+def bench_scoring(sizes: dict, repeat: int) -> dict:
+    import ats_coverage
+    import ats_utils
+
+    skills_file = str(ROOT / "data" / "skills.txt")
+    out = {}
+    for label, words in sizes.items():
+        jd = synthetic_text(words, seed=1)
+        resume = synthetic_text(max(300, words // 2), seed=2)
+        uni, bi = ats_coverage.extract_terms(jd)
+        out[f"ats_coverage.coverage[{label}]"] = measure(lambda: ats_coverage.coverage(uni, bi, resume), repeat)
+        out[f"ats_utils.compute_ats_score[{label}]"] = measure(
+            lambda: ats_utils.compute_ats_score(jd, skills_file), repeat)
+    jds = [synthetic_text(sizes["small"], seed=i) for i in range(100)]
+    out["ats_utils.compute_ats_scores[100 small JDs]"] = measure(
+        lambda: ats_utils.compute_ats_scores(jds, skills_file), repeat)
+    return out
+
+
+def bench_build_resume(repeat: int, roles: int = 5, latency: float = 0.05) -> dict:
+    import generate_resume_from_jd as gen
+    from mock_llm_server import MockConfig, running
+
+    baselines = json.loads((ROOT / "baselines.json").read_text(encoding="utf-8"))
+    template = next(iter(baselines["experience"].values()))
+    baselines["experience"] = {f"Role {i}": dict(template) for i in range(roles)}
+    saved = gen.OPENAI_API_URL, gen.OPENAI_API_KEY, gen.CACHE.enabled
+    with running(MockConfig(latency=latency)) as url, scratch_dir() as tmp:
+        gen.OPENAI_API_URL, gen.OPENAI_API_KEY, gen.CACHE.enabled = url, "bench", False
+        jd = tmp / "runs" / "bench" / "inputs" / "jd.md"
+        jd.parent.mkdir(parents=True)
+        jd.write_text("Company: Bench Co\nJob Title: Data Analyst\n---\n" + synthetic_text(400, 3), encoding="utf-8")
+        try:
+            return {f"build_resume[{roles} roles, {int(latency * 1000)}ms stub]":
+                    measure(lambda: gen.build_resume(jd, baselines), repeat)}
+        finally:
+            gen.OPENAI_API_URL, gen.OPENAI_API_KEY, gen.CACHE.enabled = saved
+
+
+def bench_render(repeat: int) -> dict:
+    try:
+        import resume_utils
+    except ImportError as e:
+        print(f"[SKIP] render_resume: {e}")
+        return {}
+    baseline = resume_utils.load_baseline(str(ROOT / "data" / "baseline_resume.json"))
+    with scratch_dir() as tmp:
+        out = str(tmp / "bench.docx")
+        template = str(ROOT / resume_utils.TEMPLATE_PATH)
+        return {
+            "resume_utils.render_resume": measure(
+                lambda: resume_utils.render_resume(out, baseline, {"ats_score": 80}), repeat),
+            "resume_utils.render_from_template": measure(
+                lambda: resume_utils.render_from_template(out, baseline, {"ats_score": 80}, template), repeat),
+        }
+
+
+def bench_sheet_sync(repeat: int, rows: int = 500) -> dict:
+    import run_manifest
+    import sheet_outbox
+    from fake_sheets import FakeSheetsService
+
+    with scratch_dir() as tmp:
+        for i in range(rows):
+            out = tmp / "runs" / f"run_{i:04d}" / "outputs"
+            out.mkdir(parents=True)
+            (out / "result.json").write_text(json.dumps({"date": "2025-09-18", "company": f"Co {i}"}), encoding="utf-8")
+
+        def once():
+            db = tmp / f"manifest_{time.perf_counter_ns()}.sqlite"
+            run_manifest.rebuild("runs", path=str(db))
+            sheet_outbox.sync(FakeSheetsService(), "bench", path=str(db))
+
+        return {f"sheet_outbox.sync[{rows} rows, fake service]": measure(once, repeat)}
+
+
+def bench_client_under_load(requests_total: int = 40, rate_limit: float = 10, latency: float = 0.05) -> dict:
+    """Throughput of ChatClient against a mock server that answers 429 past rate_limit req/s."""
+    from concurrent.futures import ThreadPoolExecutor
+    from llm_client import ChatClient
+    from mock_llm_server import MockConfig, running
+
+    config = MockConfig(latency=latency, rate_limit=rate_limit)
+    with running(config) as url:
+        client = ChatClient(url, "bench", rate=rate_limit * 2, max_concurrency=8, base_delay=0.05)
+        payload = {"model": "mock", "messages": [{"role": "user", "content": "bench"}]}
+        latencies, retries = [], []
+
+        def one(_):
+            start = time.perf_counter()
+            resp, n = client.post(payload)
+            latencies.append((time.perf_counter() - start) * 1000)
+            retries.append(n)
+            return resp.status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            statuses = list(pool.map(one, range(requests_total)))
+        elapsed = time.perf_counter() - start
+    q = statistics.quantiles(sorted(latencies), n=100, method="inclusive")
+    return {f"llm_client.post[{requests_total} req, {rate_limit:g}/s server limit]": {
+        "runs": requests_total,
+        "ops_per_sec": round(requests_total / elapsed, 2),
+        "p50_ms": round(q[49], 3),
+        "p95_ms": round(q[94], 3),
+        "p99_ms": round(q[98], 3),
+        "peak_kb": 0.0,
+        "ok": statuses.count(200),
+        "retries": sum(retries),
+        "throttled": config.throttled,
+    }}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for name, cur in results.items():
+        old = baseline.get(name)
+        if old and old["p50_ms"] > 0 and cur["p50_ms"] > old["p50_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p50 {old['p50_ms']} -> {cur['p50_ms']} ms")
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark Cassandra scripts")
+    ap.add_argument("--repeat", type=int, default=20, help="Timed runs per case")
+    ap.add_argument("--quick", action="store_true", help="Skip the large corpus and use fewer runs")
+    ap.add_argument("--only", choices=["scoring", "generate", "client", "render", "sheet"], action="append",
+                    help="Run a subset of cases, may be repeated")
+    ap.add_argument("--save", action="store_true", help=f"Write results to {BASELINE_PATH.relative_to(ROOT)}")
+    ap.add_argument("--compare", action="store_true", help="Compare against the saved baseline")
+    ap.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown for --compare")
+    args = ap.parse_args()
+
+    repeat = 5 if args.quick else args.repeat
+    sizes = {k: v for k, v in SIZES.items() if not (args.quick and k == "large")}
+    only = set(args.only or ["scoring", "generate", "client", "render", "sheet"])
+    results = {}
+    if "scoring" in only:
+        results.update(bench_scoring(sizes, repeat))
+    if "generate" in only:
+        results.update(bench_build_resume(max(3, repeat // 4)))
+    if "client" in only:
+        results.update(bench_client_under_load())
+    if "render" in only:
+        results.update(bench_render(max(3, repeat // 4)))
+    if "sheet" in only:
+        results.update(bench_sheet_sync(max(3, repeat // 4)))
+
+    print(f"{'case':<52} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak KB':>9}")
+    for name, r in results.items():
+        print(f"{name:<52} {r['ops_per_sec']:>9} {r['p50_ms']:>9} {r['p95_ms']:>9} {r['p99_ms']:>9} {r['peak_kb']:>9}")
+
+    if args.save:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"[DEBUG] Saved baseline: {BASELINE_PATH}")
+    if args.compare:
+        if not BASELINE_PATH.exists():
+            print(f"[ERROR] No baseline at {BASELINE_PATH}, run with --save first")
+            sys.exit(2)
+        regressions = compare(results, json.loads(BASELINE_PATH.read_text(encoding="utf-8")), args.threshold)
+        for r in regressions:
+            print(f"[REGRESSION] {r}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Offline bullet selection: pick the subset of known bullets that covers the most JD terms
+within the resume word budget.
+
+Candidates come from baselines.json, data/baseline_resume.json and
+includes/achievements/*.md. Each bullet is reduced to an int bitset over the JD's weighted
+terms (TF-IDF against runs/, see jd_corpus.py). The subset is then chosen by lazy-greedy
+budgeted max coverage: repeatedly take the bullet with the best new-weight-per-word
+ratio, re-scoring a heap entry only when it reaches the top.
+"""
+
+import heapq
+import json
+from pathlib import Path
+
+from ats_coverage import TermIndex, ngrams, term_weights, tokenize
+
+
+PER_ROLE_MAX = 6  # build_resume renders at most this many bullets per role
+DEFAULT_WORD_MAX = 750
+
+
+class Candidate:
+    __slots__ = ("text", "source", "role", "words", "bits", "order")
+
+    def __init__(self, text: str, source: str, role: str = None, order: int = 0):
+        self.text = text
+        self.source = source
+        self.role = role  # baselines.json experience key, None for unattached achievements
+        self.words = len(text.split())
+        self.bits = 0
+        self.order = order
+
+
+def _role_for(entry: dict, experience: dict):
+    for key, details in experience.items():
+        if entry.get("title") and entry.get("title") == details.get("title"):
+            return key
+    for key, details in experience.items():
+        if entry.get("company") and entry.get("company") == details.get("employer"):
+            return key
+    return None
+
+
+def load_candidates(baselines: dict, base: Path = Path(".")) -> list:
+    """Every distinct bullet the resume could use, attached to a baselines.json role where known."""
+    experience = baselines.get("experience", {})
+    found = []
+    for role, details in experience.items():
+        found.extend((b, "baselines.json", role) for b in details.get("bullets", []))
+
+    extra = base / "data" / "baseline_resume.json"
+    if extra.exists():
+        with open(extra, "r", encoding="utf-8") as f:
+            for entry in json.load(f).get("experience", []):
+                role = _role_for(entry, experience)
+                found.extend((b, extra.relative_to(base).as_posix(), role) for b in entry.get("bullets", []))
+
+    from includes_index import load_index
+
+    for domain, items in sorted(load_index(base).get("achievements", {}).items()):
+        found.extend((b, f"includes/achievements/{domain}.md", None) for b in items)
+
+    seen, out = set(), []
+    for text, source, role in found:
+        key = " ".join(tokenize(text))
+        if key and key not in seen:
+            seen.add(key)
+            out.append(Candidate(text, source, role, len(out)))
+    return out
+
+
+def word_budget(settings_path: Path = Path("config/settings.yaml"), fixed_words: int = 0) -> int:
+    """Words left for bullets: resume.word_count_max from settings.yaml minus the fixed sections."""
+    word_max = DEFAULT_WORD_MAX
+    if settings_path.exists():
+        from check_banned_chars import load_settings
+
+        word_max = load_settings(settings_path).get("resume", {}).get("word_count_max", word_max)
+    return max(0, word_max - fixed_words)
+
+
+class Selection:
+    def __init__(self, chosen: list, covered: int, weight: float, total: float, index: TermIndex):
+        self.chosen = chosen
+        self.covered = covered
+        self.weight = weight
+        self.total = total
+        self.index = index
+
+    @property
+    def words(self) -> int:
+        return sum(c.words for c in self.chosen)
+
+    @property
+    def coverage_percent(self) -> float:
+        return round(100.0 * self.weight / self.total, 1) if self.total else 0.0
+
+    def covered_terms(self) -> list:
+        return self.index.decode(self.covered)
+
+    def by_role(self, roles: list) -> list:
+        """Chosen bullets per role, in roles order. Unattached bullets go to the first role."""
+        out = {r: [] for r in roles}
+        for c in sorted(self.chosen, key=lambda c: c.order):
+            role = c.role if c.role in out else (roles[0] if roles else None)
+            if role is not None:
+                out[role].append(c.text)
+        return [out[r] for r in roles]
+
+
+def optimize(jd_text: str, candidates: list, budget: int, df_index=None, per_role: int = PER_ROLE_MAX,
+             roles: list = None) -> Selection:
+    """Lazy-greedy budgeted max coverage of the JD's weighted terms."""
+    weights = term_weights(jd_text, df_index)
+    index = TermIndex()
+    index.vector(sorted(weights, key=lambda t: (-weights[t], t)), grow=True)
+    bit_weight = [weights[t] for t in index.terms]
+
+    def gain(bits):
+        total = 0.0
+        while bits:
+            low = bits & -bits
+            total += bit_weight[low.bit_length() - 1]
+            bits ^= low
+        return total
+
+    for c in candidates:
+        toks = tokenize(c.text)
+        c.bits = index.vector(set(toks) | set(ngrams(toks, 2)))
+
+    first_role = roles[0] if roles else None
+    slots = {}
+
+    def slot(c):
+        return c.role if roles is None or c.role in roles else first_role
+
+    heap = [(-gain(c.bits) / max(1, c.words), c.order, c) for c in candidates if c.bits]
+    heapq.heapify(heap)
+    covered, weight, used, chosen = 0, 0.0, 0, []
+    while heap:
+        neg_ratio, order, c = heapq.heappop(heap)
+        if used + c.words > budget or slots.get(slot(c), 0) >= per_role:
+            continue
+        new = c.bits & ~covered
+        if not new:
+            continue
+        ratio = gain(new) / max(1, c.words)
+        if heap and ratio < -heap[0][0]:
+            heapq.heappush(heap, (-ratio, order, c))  # stale score, re-rank
+            continue
+        chosen.append(c)
+        covered |= new
+        weight += gain(new)
+        used += c.words
+        slots[slot(c)] = slots.get(slot(c), 0) + 1
+    return Selection(chosen, covered, weight, sum(bit_weight), index)
+
+
+def offline_bullets(jd_path: Path, baselines: dict, fixed_words: int = 0, base: Path = Path("."),
+                    candidates: list = None, df_index=None, budget: int = None):
+    """Per-role bullets for build_resume, chosen without any LLM call.
+
+    Long-running callers (scripts/watch.py) pass candidates, df_index and budget they keep warm.
+    Roles with nothing selected keep their baseline bullets, so every role still renders.
+    """
+    roles = list(baselines.get("experience", {}))
+    jd_text = jd_path.read_text(encoding="utf-8") if jd_path.exists() else ""
+    if df_index is None:
+        from jd_corpus import load_corpus_index
+
+        df_index = load_corpus_index(str(base / "runs"), str(base / ".cache" / "jd_df.json"))
+    if candidates is None:
+        candidates = load_candidates(baselines, base)
+    if budget is None:
+        budget = word_budget(base / "config" / "settings.yaml")
+    selection = optimize(jd_text, candidates, max(0, budget - fixed_words), df_index, roles=roles)
+    picked = selection.by_role(roles)
+    experience = baselines.get("experience", {})
+    return [bullets or experience[r].get("bullets", []) for r, bullets in zip(roles, picked)], selection
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from jd_corpus import load_corpus_index
+
+    ap = argparse.ArgumentParser(description="Pick the bullets that best cover a JD within the word budget")
+    ap.add_argument("jd", help="Path to runs/.../inputs/jd.md")
+    ap.add_argument("--baselines", default="baselines.json")
+    ap.add_argument("--budget", type=int, help="Word budget for bullets, defaults to resume.word_count_max")
+    args = ap.parse_args()
+    with open(args.baselines, "r", encoding="utf-8") as f:
+        baselines = json.load(f)
+    jd_text = Path(args.jd).read_text(encoding="utf-8")
+    df_index = load_corpus_index()
+    candidates = load_candidates(baselines)
+    budget = args.budget if args.budget is not None else word_budget()
+    t0 = time.perf_counter()
+    selection = optimize(jd_text, candidates, budget, df_index, roles=list(baselines.get("experience", {})))
+    elapsed = (time.perf_counter() - t0) * 1000
+    print(json.dumps({
+        "candidates": len(candidates),
+        "budget_words": budget,
+        "words": selection.words,
+        "weighted_coverage_percent": selection.coverage_percent,
+        "elapsed_ms": round(elapsed, 2),
+        "selected": [{"role": c.role, "source": c.source, "text": c.text} for c in selection.chosen],
+    }, indent=2))
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the Cassandra helper scripts.
+Each subcommand runs the matching script only when it is chosen, so heavy dependencies
+(requests, Google API client, python-docx) load only for the commands that need them.
+
+    python3 scripts/cassandra.py generate --all
+    python3 scripts/cassandra.py ats --batch --format csv
+    python3 scripts/cassandra.py bench-imports
+"""
+
+import argparse
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+COMMANDS = {
+    "generate": ("generate_resume_from_jd.py", "Generate tailored resumes from JDs"),
+    "ats": ("ats_coverage.py", "ATS coverage of resumes against JDs"),
+    "qa": ("check_banned_chars.py", "Repository QA checks"),
+    "manifest": ("run_manifest.py", "Query the run manifest"),
+    "sheet": ("update_sheet.py", "Append or sync result rows to Google Sheets"),
+    "new-run": ("new_run.py", "Create a new run folder"),
+    "pack": ("quick_pack.py", "Create an MTO pack in a run folder"),
+    "watch": ("watch.py", "Regenerate runs as their JDs change"),
+    "pipeline": ("pipeline.py", "Generate every output contract artifact for a run"),
+    "bundle": ("prompt_bundle.py", "Assemble the prompt bundle from project_index.yaml"),
+    "store": ("output_store.py", "Compact, list or restore run output versions"),
+}
+
+BENCH_MODULES = ["ats_coverage", "run_manifest", "generate_resume_from_jd", "update_sheet"]
+
+
+def run_script(script: str, argv: list):
+    sys.argv = [str(SCRIPTS_DIR / script)] + argv
+    runpy.run_path(sys.argv[0], run_name="__main__")
+
+
+def _time_import(stmt: str, repeat: int) -> float:
+    """Median wall time in ms of a fresh interpreter running stmt."""
+    code = f"import sys; sys.path.insert(0, {str(SCRIPTS_DIR)!r}); {stmt}"
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bench_imports(repeat: int = 5):
+    """Cold start cost of each script module, net of bare interpreter startup."""
+    base = _time_import("pass", repeat)
+    print(f"{'module':<28} {'median ms':>10} {'over python':>12}")
+    print(f"{'(python -c pass)':<28} {base:>10.1f} {0.0:>12.1f}")
+    for mod in BENCH_MODULES:
+        ms = _time_import(f"import {mod}", repeat)
+        print(f"{mod:<28} {ms:>10.1f} {ms - base:>12.1f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Cassandra helper scripts")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        sub.add_parser(name, help=help_text, add_help=False)
+    p_bench = sub.add_parser("bench-imports", help="Measure cold import time of each script module")
+    p_bench.add_argument("--repeat", type=int, default=5, help="Interpreter launches per module")
+    args, rest = ap.parse_known_args()
+
+    if args.cmd == "bench-imports":
+        if rest:
+            ap.error(f"unrecognized arguments: {' '.join(rest)}")
+        bench_imports(args.repeat)
+    else:
+        # Everything after the subcommand belongs to the underlying script
+        run_script(COMMANDS[args.cmd][0], rest)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,197 @@
+#!/usr/bin/env python3
+"""
+Repository QA.
+Scans every text file and .docx for the characters in config/banned_characters.txt and, with --outputs,
+checks each run's outputs against the word-count and ATS coverage limits in config/settings.yaml.
+All violations are reported together; per-file scan results are cached by mtime and size so
+repeat runs only re-read files that changed.
+"""
+
+import argparse
+import hashlib
+import json
+import os
 import sys
-import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import docx_text
+
+
+BAN_LIST = "config/banned_characters.txt"
+SETTINGS = "config/settings.yaml"
+CACHE_PATH = ".cache/qa.json"
+IGNORED_DIRS = {".git", ".cache", "_store", "__pycache__", ".pytest_cache", ".venv", "venv", "node_modules"}
+BINARY_EXTS = {".pdf", ".png", ".gif", ".jpg", ".jpeg", ".db", ".zip", ".sqlite", ".pyc"}
+
+# settings.yaml section and min/max keys, per output file
+OUTPUT_LIMITS = {
+    "resume": ("resume", "word_count_min", "word_count_max"),
+    "cover_letter.md": ("cover_letter", "word_count_min", "word_count_max"),
+    "linkedin_summary.md": ("linkedin", "summary_min", "summary_max"),
+}
+
+
+def load_ban_list(path: Path) -> list:
+    """One character per line; JSON-quoted escapes such as "\\u2014" are decoded."""
+    chars = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        chars.append(json.loads(line) if line.startswith('"') else line)
+    return chars
+
+
+def load_settings(path: Path) -> dict:
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def iter_files(base: Path):
+    for root, dirs, files in os.walk(base):
+        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+        for name in files:
+            if Path(name).suffix.lower() not in BINARY_EXTS:
+                yield Path(root) / name
+
+
+def scan_file(path: Path, needles: list) -> list:
+    """Byte-level search for each banned character, reporting every occurrence with its line."""
+    if docx_text.is_docx(path):
+        return scan_docx(path, needles)
+    data = path.read_bytes()
+    if b"\0" in data[:8192]:
+        return []
+    found = []
+    for char, needle in needles:
+        i = data.find(needle)
+        while i != -1:
+            line = data.count(b"\n", 0, i) + 1
+            found.append({"path": str(path), "line": line, "rule": "ban",
+                          "detail": f"contains forbidden character {char!r}"})
+            i = data.find(needle, i + len(needle))
+    return found
+
+
+def scan_docx(path: Path, needles: list) -> list:
+    """scan_file() over a .docx's paragraphs, reported as paragraph numbers."""
+    found = []
+    try:
+        for n, para in enumerate(docx_text.iter_paragraphs(path), 1):
+            for char, _ in needles:
+                found.extend({"path": str(path), "line": n, "rule": "ban",
+                              "detail": f"contains forbidden character {char!r}"} for _ in range(para.count(char)))
+    except ValueError:
+        return []  # Office lock files and other non-DOCX files named *.docx
+    return found
+
+
+def scan_tree(base: Path, chars: list, use_cache: bool = True, workers: int = 8) -> list:
+    needles = [(c, c.encode("utf-8")) for c in chars]
+    signature = hashlib.sha256("\n".join(chars).encode("utf-8")).hexdigest()
+    cache_file = base / CACHE_PATH
+    cache = {}
+    if use_cache and cache_file.exists():
+        try:
+            stored = json.loads(cache_file.read_text(encoding="utf-8"))
+            if stored.get("signature") == signature:
+                cache = stored.get("files", {})
+        except ValueError:
+            pass
+
+    fresh = {}
+
+    def check(path):
+        st = path.stat()
+        key = str(path.relative_to(base))
+        hit = cache.get(key)
+        if hit and hit["mtime_ns"] == st.st_mtime_ns and hit["size"] == st.st_size:
+            entry = hit
+        else:
+            entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "violations": scan_file(path, needles)}
+        fresh[key] = entry
+        return entry["violations"]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        violations = [v for vs in pool.map(check, iter_files(base)) for v in vs]
+
+    if use_cache:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"signature": signature, "files": fresh}), encoding="utf-8")
+    return violations
+
+
+def _limits_for(name: str, settings: dict):
+    key = "resume" if name.endswith((".md", ".docx")) and "resume" in name.lower() else name
+    if key not in OUTPUT_LIMITS:
+        return None
+    section, lo, hi = OUTPUT_LIMITS[key]
+    cfg = settings.get(section, {})
+    return cfg.get(lo), cfg.get(hi)
+
+
+def check_outputs(base: Path, settings: dict) -> list:
+    """Word counts per output and ATS coverage of each resume against its run's JD."""
+    from ats_coverage import coverage, read_text, select_target
+    from jd_corpus import load_corpus_index
+
+    goal = settings.get("ats", {}).get("coverage_target_percent")
+    violations = []
+    runs_dir = base / "runs"
+    if not runs_dir.exists():
+        return violations
+    df_index = load_corpus_index(str(runs_dir), str(base / ".cache" / "jd_df.json"))
+    for run in sorted(p for p in runs_dir.iterdir() if p.is_dir() and not p.name.startswith("_")):
+        jd = next((p for p in sorted((run / "inputs").glob("*.md")) if p.name.lower() == "jd.md"), None)
+        target = select_target(jd.read_text(encoding="utf-8"), df_index) if jd else None
+        for out in sorted((run / "outputs").iterdir()):
+            limits = _limits_for(out.name, settings)
+            if limits is None or out.name.startswith("~$"):
+                continue
+            try:
+                text = read_text(out)
+            except ValueError:
+                continue
+            words = len(text.split())
+            lo, hi = limits
+            if (lo is not None and words < lo) or (hi is not None and words > hi):
+                violations.append({"path": str(out), "line": 0, "rule": "word_count",
+                                   "detail": f"{words} words, expected {lo} to {hi}"})
+            if target and goal is not None and "resume" in out.name.lower():
+                pct, _, _ = coverage(set(), set(), text, target)
+                if pct < goal:
+                    violations.append({"path": str(out), "line": 0, "rule": "ats_coverage",
+                                       "detail": f"coverage {pct} percent, target {goal}"})
+    return violations
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Repository QA checks")
+    ap.add_argument("path", help="Repository root to check")
+    ap.add_argument("--outputs", action="store_true",
+                    help="Also enforce word-count and ATS coverage limits on run outputs")
+    ap.add_argument("--no-cache", action="store_true", help="Re-scan every file")
+    ap.add_argument("--workers", type=int, default=8, help="Parallel file scanners")
+    args = ap.parse_args()
+
+    base = Path(args.path)
+    ban_file = base / BAN_LIST
+    chars = load_ban_list(ban_file) if ban_file.exists() else ["\u2014"]
+    violations = scan_tree(base, chars, use_cache=not args.no_cache, workers=args.workers)
+    if args.outputs:
+        violations += check_outputs(base, load_settings(base / SETTINGS))
 
-if len(sys.argv) < 2:
-    print("Usage: python check_banned_chars.py <path>")
-    sys.exit(1)
+    for v in violations:
+        where = f"{v['path']}:{v['line']}" if v["line"] else v["path"]
+        print(f"[{v['rule']}] {where} {v['detail']}")
+    if violations:
+        print(f"[FAIL] {len(violations)} violation(s)")
+        sys.exit(1)
+    print("[OK] No QA violations")
 
-base_path = pathlib.Path(sys.argv[1])
 
-for file in base_path.rglob("*"):
-    if file.is_file():
-        text = file.read_text(encoding="utf-8", errors="ignore")
-        if "\u2014" in text:  # em dash (Unicode U+2014)
-            raise ValueError(f"[ban] {file} contains forbidden character '\u2014'")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
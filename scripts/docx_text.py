@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Plain text of a .docx without python-docx.
+
+word/document.xml is streamed out of the ZIP and fed to an incremental XML parser. Each
+paragraph is yielded as soon as it closes and then dropped from the tree, so memory stays
+flat however long the document is.
+"""
+
+import zipfile
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+
+DOCUMENT_XML = "word/document.xml"
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+BREAKS = {W + "tab": "\t", W + "br": "\n", W + "cr": "\n"}
+CHUNK_SIZE = 1 << 16
+
+
+def iter_paragraphs(path, chunk_size: int = CHUNK_SIZE):
+    """Yield the text of each w:p in document order. Raises ValueError for a file that is not a DOCX."""
+    try:
+        with zipfile.ZipFile(path) as zf, zf.open(DOCUMENT_XML) as f:
+            parser = XMLPullParser(events=("start", "end"))
+            stack, parts = [], []
+            while True:
+                data = f.read(chunk_size)
+                if data:
+                    parser.feed(data)
+                else:
+                    parser.close()
+                for event, elem in parser.read_events():
+                    if event == "start":
+                        stack.append(elem)
+                        continue
+                    stack.pop()
+                    if elem.tag == W + "t":
+                        parts.append(elem.text or "")
+                    elif elem.tag in BREAKS:
+                        parts.append(BREAKS[elem.tag])
+                    elif elem.tag == W + "p":
+                        yield "".join(parts)
+                        parts.clear()
+                        if stack:
+                            stack[-1].remove(elem)
+                if not data:
+                    return
+    except (zipfile.BadZipFile, KeyError, ParseError) as e:
+        raise ValueError(f"{path}: not a readable DOCX ({e})") from e
+
+
+def iter_chunks(path):
+    """Paragraphs as newline-terminated chunks, for text_norm.iter_tokens()."""
+    for para in iter_paragraphs(path):
+        yield para + "\n"
+
+
+def extract_text(path) -> str:
+    return "\n".join(iter_paragraphs(path))
+
+
+def is_docx(path) -> bool:
+    return str(path).lower().endswith(".docx")
+
+
+if __name__ == "__main__":
+    import sys
+
+    for p in sys.argv[1:]:
+        sys.stdout.write(extract_text(p) + "\n")
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+In-memory stand-in for the Sheets v4 service, covering spreadsheets().values().append() and get().
+Used for --dry-run syncs and benchmarks; nothing touches the network.
+"""
+
+
+class _Request:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self):
+        return self._fn()
+
+
+class FakeSheetsService:
+    def __init__(self, fail_after: int = None, rows: list = None):
+        self.rows = list(rows or [])
+        self.calls = 0
+        self.fail_after = fail_after
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def append(self, spreadsheetId, range, valueInputOption, insertDataOption, body):
+        def run():
+            if self.fail_after is not None and self.calls >= self.fail_after:
+                raise RuntimeError("fake Sheets quota exceeded")
+            self.calls += 1
+            self.rows.extend(body["values"])
+            return {"updates": {"updatedRows": len(body["values"]), "updatedRange": range}}
+        return _Request(run)
+
+    def get(self, spreadsheetId, range):
+        return _Request(lambda: {"range": range, "values": [list(r) for r in self.rows]})
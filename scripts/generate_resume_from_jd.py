@@ -7,15 +7,32 @@ Guaranteed to always write an output resume file, even if JD metadata is missing
 import os
 import sys
 import json
+import argparse
 import datetime
-import re
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import requests
+
+import text_norm
+from llm_cache import LLMCache
+from llm_client import ChatClient
+from output_store import RESUME_PREFIX, json_same_except, record, write_if_changed
+from run_manifest import has_result, record_result
+from tracing import Tracer, profiled
 
 
 BASELINES_PATH = "baselines.json"
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
-OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
+OPENAI_API_URL = os.environ.get("OPENAI_API_URL", "https://api.openai.com/v1/chat/completions")
+MAX_WORKERS = int(os.environ.get("CASSANDRA_MAX_WORKERS", "4"))
+CACHE = LLMCache(enabled=not os.environ.get("CASSANDRA_NO_CACHE"))
+SINGLE_REQUEST = bool(os.environ.get("CASSANDRA_SINGLE_REQUEST"))
+STREAM = bool(os.environ.get("CASSANDRA_STREAM"))
+BULLETS = os.environ.get("CASSANDRA_BULLETS", "llm")  # "llm" or "offline"
+# Files the offline bullet optimizer reads, in addition to baselines.json and the JD
+OFFLINE_SOURCES = ("data/baseline_resume.json", "includes/achievements/*.md", "config/settings.yaml")
 
 
 def load_baselines():
@@ -25,12 +42,62 @@ def load_baselines():
         return json.load(f)
 
 
+def discover_jds(runs_dir: str = "runs"):
+    """Every runs/*/inputs/jd.md (any case), skipping template folders."""
+    found = []
+    for run in sorted(Path(runs_dir).iterdir()):
+        if not run.is_dir() or run.name.startswith("_"):
+            continue
+        found.extend(p for p in sorted((run / "inputs").glob("*.md")) if p.name.lower() == "jd.md")
+    return found
+
+
+def input_hash(jd_path: Path, baselines: dict, bullets: str = None) -> str:
+    """Hash of the JD text, baselines and bullet mode, recorded in result.json to detect changed inputs.
+
+    Offline mode also hashes the files the bullet optimizer selects from.
+    """
+    bullets = BULLETS if bullets is None else bullets
+    h = hashlib.sha256()
+    h.update(json.dumps(baselines, sort_keys=True).encode("utf-8"))
+    h.update(jd_path.read_bytes())
+    h.update(bullets.encode("utf-8"))
+    if bullets == "offline":
+        for pattern in OFFLINE_SOURCES:
+            for p in sorted(Path().glob(pattern)):
+                h.update(p.as_posix().encode("utf-8"))
+                h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+def recorded_hash(jd_path: Path):
+    result_path = jd_path.parent.parent / "outputs" / "result.json"
+    try:
+        with open(result_path, "r", encoding="utf-8") as f:
+            return json.load(f).get("input_hash")
+    except (OSError, ValueError):
+        return None
+
+
+def make_session(pool_size: int = MAX_WORKERS):
+    """Keep-alive session whose connection pool fits the bullet worker count."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def make_client(session=None, max_workers: int = MAX_WORKERS) -> ChatClient:
+    """Rate-limited, retrying chat client; share one per batch so limits are global."""
+    return ChatClient(OPENAI_API_URL, OPENAI_API_KEY, session=session, max_concurrency=max_workers)
+
+
 def sanitize_text(text: str) -> str:
-    char_map = {8212: "-", 8211: "-", 8220: '"', 8221: '"', 8217: "'", 8216: "'", 8226: "*"}
-    for code, replacement in char_map.items():
-        text = text.replace(chr(code), replacement)
-    text = re.sub(r"[^\x00-\x7F]", "", text)
-    return re.sub(r"[ \t]+", " ", text).strip()
+    return text_norm.sanitize(text)
 
 
 def parse_jd_header(jd_path: Path):
@@ -54,38 +121,249 @@ def parse_jd_header(jd_path: Path):
         return {}
 
 
-def generate_tailored_bullets(role: str, job_title: str, company: str):
-    """Generate tailored resume bullets using OpenAI REST API."""
-    if not OPENAI_API_KEY:
-        raise RuntimeError("Missing OPENAI_API_KEY environment variable.")
+def generate_tailored_bullets(role: str, job_title: str, company: str, client: ChatClient = None, cache=CACHE,
+                              tracer: Tracer = None):
+    """Generate tailored resume bullets using OpenAI REST API, served from the local cache when possible."""
+    payload = role_payload(role, job_title, company)
+    content = complete(payload, "generate_tailored_bullets", client, cache, tracer, role=role)
+    return parse_bullets(content)
 
+
+def role_payload(role: str, job_title: str, company: str) -> dict:
     prompt = (
         f"Generate 4-6 strong resume bullet points for the role '{role}' "
         f"that align with the job title '{job_title}' at {company}. "
         "Each bullet must begin with a strong action verb, be specific, "
         "and highlight measurable impact where possible. Return only the bullets."
     )
+    return {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": prompt}], "max_tokens": 400}
 
-    headers = {"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"}
-    payload = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": prompt}], "max_tokens": 400}
-
-    resp = requests.post(OPENAI_API_URL, headers=headers, json=payload, timeout=60)
-    if resp.status_code != 200:
-        raise RuntimeError(f"OpenAI API call failed ({resp.status_code}): {resp.text}")
 
-    content = resp.json()["choices"][0]["message"]["content"]
+def parse_bullets(content: str) -> list:
     bullets = [sanitize_text(line.strip("*- ").strip()) for line in content.splitlines() if line.strip()]
     return bullets[:6] if bullets else []
 
 
-def build_resume(jd_path: Path, baselines: dict):
-    jd_data = parse_jd_header(jd_path) if jd_path.exists() else {}
+def stream_tailored_bullets(role: str, job_title: str, company: str, client: ChatClient = None, cache=CACHE,
+                            tracer: Tracer = None) -> list:
+    """generate_tailored_bullets() over a streamed (SSE) completion.
+
+    Shares cache entries with the non-streaming call and records time to first complete
+    bullet line as ttfb_ms on the trace span.
+    """
+    payload = role_payload(role, job_title, company)
+    with (tracer or Tracer()).span("generate_tailored_bullets", role=role, stream=True) as sp:
+        key = LLMCache.key(payload, client.api_url if client else OPENAI_API_URL)
+        content = cache.get(key)
+        sp["cache_hit"] = content is not None
+        if content is None:
+            if not OPENAI_API_KEY:
+                raise RuntimeError("Missing OPENAI_API_KEY environment variable.")
+            t0 = time.perf_counter()
+            parts, pending = [], ""
+            for delta in (client or make_client()).stream(payload, timeout=60, meta=sp):
+                parts.append(delta)
+                pending += delta
+                *complete_lines, pending = pending.split("\n")
+                if "ttfb_ms" not in sp and any(line.strip() for line in complete_lines):
+                    sp["ttfb_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+            content = "".join(parts)
+            if "ttfb_ms" not in sp and content.strip():
+                sp["ttfb_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+            cache.put(key, content)
+    return parse_bullets(content)
+
+
+def complete(payload: dict, span_name: str, client: ChatClient = None, cache=CACHE, tracer: Tracer = None,
+             validate=None, **attrs):
+    """Completion text for payload, from the cache or one traced API call.
+
+    validate(content) may raise to keep a malformed completion out of the cache.
+    """
+    with (tracer or Tracer()).span(span_name, **attrs) as sp:
+        key = LLMCache.key(payload, client.api_url if client else OPENAI_API_URL)
+        content = cache.get(key)
+        sp["cache_hit"] = content is not None
+
+        if content is None:
+            if not OPENAI_API_KEY:
+                raise RuntimeError("Missing OPENAI_API_KEY environment variable.")
+            resp, retries = (client or make_client()).post(payload, timeout=60)
+            sp["status"] = resp.status_code
+            sp["retries"] = retries
+            if resp.status_code != 200:
+                raise RuntimeError(f"OpenAI API call failed ({resp.status_code}): {resp.text}")
+            data = resp.json()
+            usage = data.get("usage", {})
+            sp["prompt_tokens"] = usage.get("prompt_tokens")
+            sp["completion_tokens"] = usage.get("completion_tokens")
+            content = data["choices"][0]["message"]["content"]
+            if validate:
+                validate(content)
+            cache.put(key, content)
+    return content
+
+
+def bullets_schema(roles: list) -> dict:
+    """JSON schema for one response carrying bullets for every role."""
+    return {
+        "type": "object",
+        "properties": {
+            "roles": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "role": {"type": "string", "enum": roles},
+                        "bullets": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "required": ["role", "bullets"],
+                    "additionalProperties": False,
+                },
+            }
+        },
+        "required": ["roles"],
+        "additionalProperties": False,
+    }
+
+
+def generate_structured_bullets(experience_data: dict, job_title: str, company: str,
+                                client: ChatClient = None, cache=CACHE, tracer: Tracer = None) -> dict:
+    """Bullets for all roles from a single JSON-schema completion.
+
+    Returns {role: bullets} for entries that parsed and validated; roles that are missing
+    or invalid are left out for the caller to fill per role.
+    """
+    roles = list(experience_data)
+    role_lines = "\n".join(
+        f"- {role}: {d.get('title', role)} at {d.get('employer', '')}" for role, d in experience_data.items()
+    )
+    prompt = (
+        f"For each role below, generate 4-6 strong resume bullet points that align with the job title "
+        f"'{job_title}' at {company}. Each bullet must begin with a strong action verb, be specific, "
+        "and highlight measurable impact where possible. Use each role name exactly as given.\n"
+        f"{role_lines}"
+    )
+    payload = {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": 400 * len(roles),
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": "role_bullets", "strict": True, "schema": bullets_schema(roles)},
+        },
+    }
+    content = complete(payload, "generate_structured_bullets", client, cache, tracer,
+                       validate=json.loads, roles=len(roles))
+
+    parsed = {}
+    for entry in json.loads(content).get("roles", []):
+        if not isinstance(entry, dict) or entry.get("role") not in experience_data:
+            continue
+        bullets = entry.get("bullets")
+        if not isinstance(bullets, list):
+            continue
+        bullets = [sanitize_text(b.strip("*- ").strip()) for b in bullets if isinstance(b, str) and b.strip()]
+        if bullets:
+            parsed[entry["role"]] = bullets[:6]
+    return parsed
+
+
+def generate_all_bullets(experience_data: dict, job_title: str, company: str,
+                         max_workers: int = MAX_WORKERS, client: ChatClient = None, tracer: Tracer = None,
+                         single_request: bool = SINGLE_REQUEST, stream: bool = False, on_role=None):
+    """Tailor bullets for every role, returned in baseline role order.
+
+    With single_request, one structured completion covers all roles and only roles it
+    misses are requested individually; otherwise every role is requested concurrently.
+    Per-role requests use streaming completions when stream is set. on_role(index, bullets)
+    is called as each role finishes, in whatever order that happens.
+    """
+    structured = {}
+    if single_request and experience_data:
+        try:
+            structured = generate_structured_bullets(experience_data, job_title, company, client, tracer=tracer)
+        except Exception as e:
+            print(f"[WARN] Structured bullet gen failed, falling back per role: {e}")
+        missing = [role for role in experience_data if role not in structured]
+        if structured and missing:
+            print(f"[WARN] Structured response missing {len(missing)} role(s): {', '.join(missing)}")
+
+    generate = stream_tailored_bullets if stream else generate_tailored_bullets
+
+    def one(indexed):
+        i, (role, details) = indexed
+        if role in structured:
+            bullets = structured[role]
+        else:
+            try:
+                bullets = generate(role, job_title, company, client=client, tracer=tracer)
+            except Exception as e:
+                print(f"[WARN] Bullet gen failed for {role}: {e}")
+                bullets = details.get("bullets", [])
+        if on_role:
+            on_role(i, bullets)
+        return bullets
+
+    items = list(enumerate(experience_data.items()))
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+        return list(pool.map(one, items))
+
+
+class ProgressiveWriter:
+    """Streams the resume to disk: head first, then each role section in baseline order as
+    soon as it and every earlier role are ready, then the tail. A run cut short still
+    leaves the head and every completed role on disk."""
+
+    def __init__(self, path: Path, head: list):
+        self._f = open(path, "w", encoding="utf-8", newline="\n")
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._next = 0
+        self._write(head, first=True)
+
+    def _write(self, lines: list, first: bool = False):
+        if lines:
+            self._f.write(("" if first else "\n") + "\n".join(lines))
+            self._f.flush()
+
+    def section(self, index: int, lines: list):
+        with self._lock:
+            self._pending[index] = lines
+            while self._next in self._pending:
+                self._write(self._pending.pop(self._next))
+                self._next += 1
+
+    def close(self, tail: list):
+        with self._lock:
+            self._write(tail)
+            self._f.close()
+
+
+def build_resume(jd_path: Path, baselines: dict, max_workers: int = MAX_WORKERS, client: ChatClient = None,
+                 digest: str = None, tracer: Tracer = None, single_request: bool = None, stream: bool = None,
+                 bullets: str = None, select_bullets=None):
+    """Write the run's resume markdown and result.json. Returns (resume path, result).
+
+    select_bullets overrides bullet_optimizer.offline_bullets for bullets="offline", so a
+    long-running caller can keep candidates and indexes in memory.
+    """
+    tracer = tracer or Tracer()
+    with tracer.span("parse_jd_header"):
+        jd_data = parse_jd_header(jd_path) if jd_path.exists() else {}
     folder_name = jd_path.parent.parent.name if jd_path.exists() else "unknown"
     company = jd_data.get("company", folder_name)
     job_title = jd_data.get("job_title", company.replace("_", " "))
     jd_url = jd_data.get("url", "")
     closing_date = jd_data.get("closing_date", "")
 
+    # Outputs
+    out_dir = jd_path.parent.parent / "outputs" if jd_path.exists() else Path("runs/outputs")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    md_file = out_dir / f"{RESUME_PREFIX}{company.replace(' ', '_')}.md"
+
     resume_md = []
     contact = baselines.get("contact", {})
     name = contact.get("name", "Gamal Mensah")
@@ -117,43 +395,77 @@ def build_resume(jd_path: Path, baselines: dict):
     # Experience
     resume_md.append("## Professional Experience")
     experience_data = baselines.get("experience", {})
-    for role, details in experience_data.items():
+    roles = list(experience_data.items())
+
+    def role_section(index, bullets):
+        role, details = roles[index]
         title = details.get("title", role)
         employer = details.get("employer", "")
         dates = details.get("dates", "")
         loc = details.get("location", "")
-        resume_md.append(f"### {title} | {employer}")
-        resume_md.append(f"{dates} | {loc}")
-
-        try:
-            bullets = generate_tailored_bullets(role, job_title, company)
-        except Exception as e:
-            print(f"[WARN] Bullet gen failed for {role}: {e}")
-            bullets = details.get("bullets", [])
-
-        for b in bullets[:6]:
-            resume_md.append(f"- {sanitize_text(b)}")
-        resume_md.append("")
+        lines = [f"### {title} | {employer}", f"{dates} | {loc}"]
+        lines.extend(f"- {sanitize_text(b)}" for b in bullets[:6])
+        lines.append("")
+        return lines
 
+    tail = []
     # Education
-    resume_md.append("## Education")
+    tail.append("## Education")
     for edu in baselines.get("education", []):
-        resume_md.append(f"- {sanitize_text(edu)}")
-    resume_md.append("")
+        tail.append(f"- {sanitize_text(edu)}")
+    tail.append("")
 
     # Skills
-    resume_md.append("## Skills")
+    tail.append("## Skills")
     for skill in baselines.get("skills", []):
-        resume_md.append(f"- {sanitize_text(skill)}")
-    resume_md.append("")
+        tail.append(f"- {sanitize_text(skill)}")
+    tail.append("")
 
-    # Outputs
-    out_dir = jd_path.parent.parent / "outputs" if jd_path.exists() else Path("runs/outputs")
-    out_dir.mkdir(parents=True, exist_ok=True)
-    md_file = out_dir / f"Gamal_Mensah_Resume_{company.replace(' ', '_')}.md"
-    with open(md_file, "w", encoding="utf-8", newline="\n") as f:
-        f.write("\n".join(resume_md))
-    print(f"[DEBUG] Wrote resume: {md_file}")
+    bullets = BULLETS if bullets is None else bullets
+    stream = (STREAM if stream is None else stream) and bullets != "offline"
+    writer = ProgressiveWriter(md_file, resume_md) if stream else None
+    on_role = (lambda i, bullets: writer.section(i, role_section(i, bullets))) if writer else None
+    if bullets == "offline":
+        if select_bullets is None:
+            from bullet_optimizer import offline_bullets as select_bullets
+
+        fixed = resume_md + tail + [l for i in range(len(roles)) for l in role_section(i, [])]
+        with tracer.span("optimize_bullets", roles=len(roles)) as sp:
+            role_bullets, selection = select_bullets(jd_path, baselines, len(" ".join(fixed).split()))
+            sp["coverage_percent"] = selection.coverage_percent
+            sp["words"] = selection.words
+    else:
+        session = None
+        if client is None:
+            session = make_session(max_workers)
+            client = make_client(session, max_workers)
+        try:
+            with tracer.span("generate_all_bullets", roles=len(experience_data)):
+                role_bullets = generate_all_bullets(experience_data, job_title, company, max_workers, client, tracer,
+                                                    SINGLE_REQUEST if single_request is None else single_request,
+                                                    stream=stream, on_role=on_role)
+        except BaseException:
+            if writer:
+                writer.close([])
+            raise
+        finally:
+            if session is not None:
+                session.close()
+        print(f"[DEBUG] LLM cache: {CACHE.hits} hits, {CACHE.misses} misses")
+    for i, items in enumerate(role_bullets):
+        resume_md.extend(role_section(i, items))
+
+    resume_md.extend(tail)
+
+    with tracer.span("write_resume", path=str(md_file), stream=stream) as sp:
+        if writer:
+            writer.close(tail)
+            record(md_file)
+            sp["written"] = True
+        else:
+            sp["written"] = write_if_changed(md_file, "\n".join(resume_md))
+    resume_written = sp["written"]
+    print(f"[DEBUG] {'Wrote' if resume_written else 'Unchanged'} resume: {md_file}")
 
     result = {
         "date": datetime.date.today().isoformat(),
@@ -163,20 +475,134 @@ def build_resume(jd_path: Path, baselines: dict):
         "closing_date": sanitize_text(closing_date) if closing_date else "TBD Closing Date",
         "jd_url": sanitize_text(jd_url),
         "ats_score": "fallback",
+        "resume_file": md_file.name,
+        "resume_sha256": hashlib.sha256(md_file.read_bytes()).hexdigest(),
     }
+    if bullets == "offline":
+        result["bullets"] = "offline"
+    if digest:
+        result["input_hash"] = digest
     result_path = out_dir / "result.json"
-    with open(result_path, "w", encoding="utf-8", newline="\n") as f:
-        json.dump(result, f, indent=2, ensure_ascii=True)
-    print(f"[DEBUG] Wrote metadata: {result_path}")
+    with tracer.span("write_result", path=str(result_path)) as sp:
+        # date changes on every run; an otherwise identical result.json keeps its mtime
+        sp["written"] = write_if_changed(result_path, json.dumps(result, indent=2, ensure_ascii=True),
+                                         same=json_same_except("date"))
+    tracer.write_jsonl(out_dir / "trace.jsonl")
+    print(f"[DEBUG] {'Wrote' if sp['written'] else 'Unchanged'} metadata: {result_path}")
+    try:
+        # the manifest is gitignored, so a fresh clone has no row even for an unchanged result.json
+        if resume_written or sp["written"] or not has_result(result_path):
+            record_result(result_path, result)
+    except Exception as e:
+        print(f"[WARN] Failed to update run manifest: {e}")
+    return md_file, result
+
+
+def backfill_hashes(baselines: dict, runs_dir: str = "runs") -> int:
+    """Record the current input hash in every result.json that has none, without regenerating.
+
+    Run once (and commit) before the first --all, so existing runs count as up to date
+    instead of all being regenerated.
+    """
+    count = 0
+    for jd_path in discover_jds(runs_dir):
+        result_path = jd_path.parent.parent / "outputs" / "result.json"
+        try:
+            with open(result_path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if result.get("input_hash"):
+            continue
+        result["input_hash"] = input_hash(jd_path, baselines)
+        write_if_changed(result_path, json.dumps(result, indent=2, ensure_ascii=True))
+        count += 1
+    return count
+
+
+def run_batch(baselines: dict, runs_dir: str = "runs", jobs: int = 2,
+              max_workers: int = MAX_WORKERS, force: bool = False):
+    """Regenerate every run whose JD, baselines or bullet sources changed since its last result.json."""
+    pending = []
+    for jd_path in discover_jds(runs_dir):
+        digest = input_hash(jd_path, baselines)
+        if not force and recorded_hash(jd_path) == digest:
+            print(f"[DEBUG] Unchanged, skipping: {jd_path}")
+            continue
+        pending.append((jd_path, digest))
+    print(f"[DEBUG] {len(pending)} run(s) to regenerate")
+    if not pending:
+        return []
+
+    session = make_session(jobs * max_workers)
+    client = make_client(session, jobs * max_workers)
+
+    def one(item):
+        jd_path, digest = item
+        try:
+            build_resume(jd_path, baselines, max_workers=max_workers, client=client, digest=digest)
+            return jd_path, None
+        except Exception as e:
+            print(f"[WARN] Run failed for {jd_path}: {e}")
+            return jd_path, e
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            return list(pool.map(one, pending))
+    finally:
+        session.close()
 
 
-def main(jd_path: str):
-    baselines = load_baselines()
-    build_resume(Path(jd_path), baselines)
+def main(jd_path: str, max_workers: int = MAX_WORKERS, profile: str = None):
+    tracer = Tracer()
+    with profiled(profile):
+        with tracer.span("load_baselines"):
+            baselines = load_baselines()
+        jd = Path(jd_path)
+        build_resume(jd, baselines, max_workers=max_workers,
+                     digest=input_hash(jd, baselines) if jd.exists() else None, tracer=tracer)
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python generate_resume_from_jd.py <jd.md>")
+        print("Usage: python generate_resume_from_jd.py <jd.md> | --all [--jobs N] [--force] [--workers N] [--no-cache]")
         sys.exit(1)
-    main(sys.argv[1])
+    ap = argparse.ArgumentParser(description="Generate a tailored resume from a JD")
+    ap.add_argument("jd_path", nargs="?", help="Path to runs/.../inputs/jd.md")
+    ap.add_argument("--all", action="store_true",
+                    help="Regenerate every runs/*/inputs/jd.md whose inputs changed")
+    ap.add_argument("--jobs", type=int, default=2, help="Runs regenerated in parallel with --all")
+    ap.add_argument("--force", action="store_true", help="With --all, regenerate unchanged runs too")
+    ap.add_argument("--backfill", action="store_true",
+                    help="Record input hashes in existing result.json files that lack one, without regenerating")
+    ap.add_argument("--workers", type=int, default=MAX_WORKERS,
+                    help="Concurrent bullet requests, defaults to CASSANDRA_MAX_WORKERS or 4")
+    ap.add_argument("--no-cache", action="store_true",
+                    help="Bypass the local LLM response cache (also CASSANDRA_NO_CACHE=1)")
+    ap.add_argument("--single-request", action="store_true",
+                    help="One structured request for all roles (also CASSANDRA_SINGLE_REQUEST=1)")
+    ap.add_argument("--stream", action="store_true",
+                    help="Stream per-role completions and write the resume progressively (also CASSANDRA_STREAM=1)")
+    ap.add_argument("--bullets", choices=["llm", "offline"], default=BULLETS,
+                    help="offline picks existing bullets for JD coverage without any LLM call (also CASSANDRA_BULLETS)")
+    ap.add_argument("--profile", choices=["cprofile", "tracemalloc"], default=os.environ.get("CASSANDRA_PROFILE"),
+                    help="Profile the run; cprofile covers the main thread only (also CASSANDRA_PROFILE)")
+    args = ap.parse_args()
+    if args.no_cache:
+        CACHE.enabled = False
+    if args.single_request:
+        SINGLE_REQUEST = True
+    if args.stream:
+        STREAM = True
+    BULLETS = args.bullets
+    if args.backfill:
+        print(f"[DEBUG] Backfilled input_hash in {backfill_hashes(load_baselines())} result.json file(s)")
+        sys.exit(0)
+    if args.all:
+        with profiled(args.profile):
+            failed = [p for p, err in run_batch(load_baselines(), jobs=args.jobs,
+                                                max_workers=args.workers, force=args.force) if err]
+        sys.exit(1 if failed else 0)
+    if not args.jd_path:
+        ap.error("jd_path is required unless --all is given")
+    main(args.jd_path, args.workers, args.profile)
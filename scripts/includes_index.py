@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Compiled index of includes/overlays/*.md and includes/achievements/*.md.
+The parsed index is cached in .cache/includes_index.json and rebuilt only when a source
+file is added, removed or has a new mtime, so callers pay for a few stat() calls instead
+of re-reading and re-parsing markdown.
+"""
+
+import json
+from pathlib import Path
+
+
+CACHE_PATH = ".cache/includes_index.json"
+SOURCES = ("includes/overlays/*.md", "includes/achievements/*.md")
+
+
+def parse_sections(text: str) -> dict:
+    """Map each "## Heading" (lowercased) to its bullet items, or to its plain lines if it has no bullets."""
+    sections, current = {}, None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith("## "):
+            current = sections.setdefault(line[3:].strip().lower(), [])
+        elif line.startswith("# "):
+            current = sections.setdefault("", [])
+        elif line and current is not None:
+            current.append(line)
+        elif line:
+            current = sections.setdefault("", [line])
+    return {k: ([l[2:].strip() for l in v if l.startswith("- ")] or v) for k, v in sections.items()}
+
+
+def parse_overlay(text: str) -> dict:
+    s = parse_sections(text)
+    core = ",".join(s.get("core skills", []))
+    return {
+        "headline": s.get("headline options", []),
+        "summary": s.get("summary starters", []),
+        "core": [c.strip() for c in core.split(",") if c.strip()],
+    }
+
+
+def parse_achievements(text: str) -> list:
+    return [item for items in parse_sections(text).values() for item in items if not item.startswith("#")]
+
+
+def _sources(base: Path) -> dict:
+    return {p.relative_to(base).as_posix(): p.stat().st_mtime_ns
+            for pattern in SOURCES for p in sorted(base.glob(pattern))}
+
+
+def build_index(base: Path, sources: dict) -> dict:
+    index = {"sources": sources, "overlays": {}, "achievements": {}}
+    for rel in sources:
+        path = base / rel
+        text = path.read_text(encoding="utf-8")
+        if rel.startswith("includes/overlays/"):
+            index["overlays"][path.stem] = parse_overlay(text)
+        else:
+            index["achievements"][path.stem] = parse_achievements(text)
+    return index
+
+
+def load_index(base: Path) -> dict:
+    """Cached index, rebuilt when any source mtime changed."""
+    base = Path(base)
+    cache_file = base / CACHE_PATH
+    sources = _sources(base)
+    if cache_file.exists():
+        try:
+            index = json.loads(cache_file.read_text(encoding="utf-8"))
+            if index.get("sources") == sources:
+                return index
+        except ValueError:
+            pass
+    index = build_index(base, sources)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps(index, indent=1), encoding="utf-8")
+    return index
+
+
+if __name__ == "__main__":
+    import sys
+    print(json.dumps(load_index(Path(sys.argv[1] if len(sys.argv) > 1 else ".")), indent=2))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Incrementally maintained document-frequency index over every JD in runs/.
+Persisted to .cache/jd_df.json with each JD's mtime, size, hash and term set, so an update
+re-tokenizes only JDs that were added or changed and drops JDs that disappeared.
+"""
+
+import hashlib
+import json
+import math
+from collections import Counter
+from pathlib import Path
+
+
+INDEX_PATH = ".cache/jd_df.json"
+
+
+def jd_terms(text: str) -> set:
+    """Unigram and bigram terms of a JD, as ats_coverage.extract_terms() defines them."""
+    from ats_coverage import extract_terms
+
+    uni, bi = extract_terms(text)
+    return uni | bi
+
+
+class DocFreqIndex:
+    def __init__(self, docs: dict = None):
+        self.docs = docs or {}  # path -> {"mtime_ns", "size", "hash", "terms"}
+        self.df = Counter()
+        for doc in self.docs.values():
+            self.df.update(doc["terms"])
+
+    @property
+    def n_docs(self) -> int:
+        return len(self.docs)
+
+    @classmethod
+    def load(cls, path: str = INDEX_PATH) -> "DocFreqIndex":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(json.load(f).get("docs", {}))
+        except (OSError, ValueError):
+            return cls()
+
+    def save(self, path: str = INDEX_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"docs": self.docs}, f)
+
+    def _remove(self, key: str):
+        self.df.subtract(self.docs.pop(key)["terms"])
+        self.df += Counter()  # drop zero counts
+
+    def update(self, jd_paths) -> int:
+        """Sync the index with jd_paths. Returns how many documents were (re)indexed or removed."""
+        changed = 0
+        seen = set()
+        for p in jd_paths:
+            p = Path(p)
+            key = p.as_posix()
+            seen.add(key)
+            st = p.stat()
+            doc = self.docs.get(key)
+            if doc and doc["mtime_ns"] == st.st_mtime_ns and doc["size"] == st.st_size:
+                continue
+            data = p.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if doc and doc["hash"] == digest:
+                doc["mtime_ns"], doc["size"] = st.st_mtime_ns, st.st_size
+                changed += 1
+                continue
+            if doc:
+                self._remove(key)
+            terms = sorted(jd_terms(data.decode("utf-8", errors="ignore")))
+            self.docs[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": digest, "terms": terms}
+            self.df.update(terms)
+            changed += 1
+        for key in [k for k in self.docs if k not in seen]:
+            self._remove(key)
+            changed += 1
+        return changed
+
+    def idf(self, term: str) -> float:
+        """Smoothed inverse document frequency; unseen terms score highest."""
+        return math.log((1 + self.n_docs) / (1 + self.df.get(term, 0))) + 1
+
+
+def load_corpus_index(runs_dir: str = "runs", path: str = INDEX_PATH) -> DocFreqIndex:
+    """Index for all JDs under runs_dir, updated and re-saved only if something changed."""
+    from ats_coverage import discover
+
+    index = DocFreqIndex.load(path)
+    jds, _ = discover(runs_dir) if Path(runs_dir).exists() else ([], [])
+    if index.update(jds):
+        index.save(path)
+    return index
+
+
+if __name__ == "__main__":
+    import sys
+
+    idx = load_corpus_index(sys.argv[1] if len(sys.argv) > 1 else "runs")
+    common = sorted(idx.df.items(), key=lambda kv: (-kv[1], kv[0]))[:20]
+    print(json.dumps({"documents": idx.n_docs, "terms": len(idx.df), "most_common": common}, indent=2))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+On-disk cache for LLM completions.
+Entries are keyed by a SHA-256 of the API URL, model, prompt and request parameters, so
+completions from a mock or proxy endpoint are never served to runs against the real API.
+They expire after a TTL and are evicted least recently used first once the cache holds more
+than max_entries.
+The cache directory is only scanned when a put takes it over the limit, or every EVICT_EVERY puts.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+CACHE_DIR = os.environ.get("CASSANDRA_CACHE_DIR", ".cache/llm")
+CACHE_TTL = int(os.environ.get("CASSANDRA_CACHE_TTL", str(30 * 24 * 3600)))
+CACHE_MAX_ENTRIES = int(os.environ.get("CASSANDRA_CACHE_MAX_ENTRIES", "2000"))
+EVICT_EVERY = 100  # puts between full scans, to pick up entries other processes wrote
+
+
+class LLMCache:
+    def __init__(self, root=CACHE_DIR, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, enabled=True):
+        self.root = Path(root)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._count = None  # entries on disk, as of the last scan plus puts since
+        self._puts = 0
+
+    @staticmethod
+    def key(payload: dict, api_url: str) -> str:
+        """Stable hash of the endpoint and the full request payload (model, messages, parameters)."""
+        blob = json.dumps([api_url, payload], sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str):
+        """Cached completion text, or None on miss, expiry or bypass."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+        if entry is not None and time.time() - entry.get("created", 0) > self.ttl:
+            path.unlink(missing_ok=True)
+            entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        # mtime doubles as last access time for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # evicted by another worker since the read
+        return entry["content"]
+
+    def put(self, key: str, content: str):
+        if not self.enabled:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        new = not path.exists()
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"created": time.time(), "content": content}, f)
+        os.replace(tmp, path)
+        with self._lock:
+            self._puts += 1
+            if self._count is not None:
+                self._count += new
+            scan = self._count is None or self._count > self.max_entries or self._puts % EVICT_EVERY == 0
+        if scan:
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries down to 90% of max_entries, so a full cache is not
+        rescanned on every put. Never raises for files that vanish mid-scan."""
+        entries = []
+        for p in self.root.glob("*/*.json"):
+            try:
+                entries.append((p.stat().st_mtime, p))
+            except OSError:
+                continue  # removed by another worker since the glob
+        excess = len(entries) - self.max_entries
+        if excess > 0:
+            excess += self.max_entries // 10
+            entries.sort(key=lambda e: e[0])
+            for _, p in entries[:excess]:
+                try:
+                    p.unlink()
+                except OSError:
+                    pass
+        with self._lock:
+            self._count = len(entries) - max(0, excess)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
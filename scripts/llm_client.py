@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Chat-completions client with client-side rate limiting and retries.
+A token bucket caps request rate, an AIMD limiter halves concurrency on 429/5xx and grows
+it back on success, and failed calls are retried honouring Retry-After or, failing that,
+exponential backoff with full jitter.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+RATE_LIMIT = float(os.environ.get("CASSANDRA_RATE_LIMIT", "5"))  # requests per second
+MAX_RETRIES = int(os.environ.get("CASSANDRA_MAX_RETRIES", "5"))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until one token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveLimiter:
+    """Additive-increase, multiplicative-decrease cap on in-flight requests."""
+
+    def __init__(self, initial: int, maximum: int, minimum: int = 1):
+        self.limit = max(minimum, initial)
+        self.minimum = minimum
+        self.maximum = max(maximum, self.limit)
+        self.in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self):
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def on_throttle(self):
+        with self._cond:
+            self.limit = max(self.minimum, self.limit // 2)
+            self._successes = 0
+
+
+def retry_after_seconds(value):
+    """Retry-After as seconds; accepts delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def iter_sse(lines):
+    """JSON events from server-sent event lines, stopping at "data: [DONE]"."""
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        if data:
+            yield json.loads(data)
+
+
+class ChatClient:
+    def __init__(self, api_url: str, api_key: str, session=None, rate: float = RATE_LIMIT,
+                 max_concurrency: int = 4, max_retries: int = MAX_RETRIES,
+                 base_delay: float = 0.5, max_delay: float = 30.0):
+        if session is None:
+            import requests
+            session = requests
+        self.api_url = api_url
+        self.headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        self.session = session
+        self.bucket = TokenBucket(rate)
+        self.limiter = AdaptiveLimiter(initial=max_concurrency, maximum=max_concurrency * 2)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def post(self, payload: dict, timeout: float = 60, **kwargs):
+        """POST with retries. Returns (response, retries); the last response is returned
+        even if it still failed, so callers keep their own status handling."""
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            error = None
+            with self.limiter:
+                try:
+                    resp = self.session.post(self.api_url, headers=self.headers, json=payload,
+                                             timeout=timeout, **kwargs)
+                except Exception as e:  # connection errors, timeouts
+                    resp, error = None, e
+            if resp is not None and resp.status_code not in RETRY_STATUSES:
+                # other 4xx say nothing about capacity, so the limit only grows on 2xx
+                if 200 <= resp.status_code < 300:
+                    self.limiter.on_success()
+                return resp, attempt
+            self.limiter.on_throttle()
+            if attempt >= self.max_retries:
+                if error is not None:
+                    raise error
+                return resp, attempt
+            delay = retry_after_seconds(resp.headers.get("Retry-After")) if resp is not None else None
+            if delay is None:
+                delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+            time.sleep(min(delay, self.max_delay))
+            attempt += 1
+
+    def stream(self, payload: dict, timeout: float = 60, meta: dict = None):
+        """Yield content deltas from a streaming completion.
+
+        Retries apply until the response starts. meta, if given, receives status, retries
+        and, when the server reports usage, prompt and completion token counts.
+        """
+        meta = meta if meta is not None else {}
+        payload = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+        resp, retries = self.post(payload, timeout=timeout, stream=True)
+        meta["status"] = resp.status_code
+        meta["retries"] = retries
+        if resp.status_code != 200:
+            raise RuntimeError(f"OpenAI API call failed ({resp.status_code}): {resp.text}")
+        try:
+            for event in iter_sse(resp.iter_lines()):
+                usage = event.get("usage")
+                if usage:
+                    meta["prompt_tokens"] = usage.get("prompt_tokens")
+                    meta["completion_tokens"] = usage.get("completion_tokens")
+                for choice in event.get("choices") or []:
+                    delta = (choice.get("delta") or {}).get("content")
+                    if delta:
+                        yield delta
+        finally:
+            resp.close()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Local mock of the OpenAI chat-completions endpoint for offline load testing.
+Injects latency, a server-side request rate limit (429 with Retry-After) and random 5xx.
+
+    python3 scripts/mock_llm_server.py --port 8765 --latency 0.2 --rate-limit 3
+    OPENAI_API_URL=http://127.0.0.1:8765/v1/chat/completions OPENAI_API_KEY=mock ...
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+BULLETS = "- Built dashboards\n- Reduced reporting time by 40%\n- Automated ETL"
+
+
+class MockConfig:
+    def __init__(self, latency=0.05, jitter=0.0, rate_limit=0.0, error_rate=0.0, content=BULLETS):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit  # requests per second, 0 disables
+        self.error_rate = error_rate
+        self.content = content
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self._window = []
+        self._lock = threading.Lock()
+
+    def admit(self):
+        """None if the request may proceed, otherwise seconds until it could."""
+        with self._lock:
+            self.requests += 1
+            if not self.rate_limit:
+                return None
+            now = time.monotonic()
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.rate_limit:
+                self.throttled += 1
+                return 1.0 - (now - self._window[0])
+            self._window.append(now)
+            return None
+
+
+def structured_content(payload: dict, bullets: str) -> str:
+    """For json_schema requests, answer every role named in the schema's role enum."""
+    fmt = payload.get("response_format") or {}
+    if fmt.get("type") != "json_schema":
+        return bullets
+    schema = fmt["json_schema"]["schema"]
+    roles = schema["properties"]["roles"]["items"]["properties"]["role"].get("enum", [])
+    items = [b.lstrip("- ").strip() for b in bullets.splitlines() if b.strip()]
+    return json.dumps({"roles": [{"role": r, "bullets": items} for r in roles]})
+
+
+def make_handler(config: MockConfig):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _send(self, status, body: dict, headers=None):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            wait = config.admit()
+            if wait is not None:
+                return self._send(429, {"error": {"message": "Rate limit reached"}},
+                                  {"Retry-After": f"{max(wait, 0.01):.2f}"})
+            if not payload.get("stream"):
+                time.sleep(max(0.0, config.latency + random.uniform(-config.jitter, config.jitter)))
+            if config.error_rate and random.random() < config.error_rate:
+                with config._lock:
+                    config.errors += 1
+                return self._send(503, {"error": {"message": "Injected failure"}})
+            prompt = " ".join(m.get("content", "") for m in payload.get("messages", []))
+            content = structured_content(payload, config.content)
+            if payload.get("stream"):
+                return self._stream(content, len(prompt.split()), payload)
+            self._send(200, {
+                "choices": [{"message": {"role": "assistant", "content": content}}],
+                "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": len(content.split())},
+            })
+
+        def _stream(self, content: str, prompt_tokens: int, payload: dict):
+            """SSE chat.completion.chunk events, one per word, spread over config.latency."""
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            words = content.split(" ")
+            pause = config.latency / max(1, len(words))
+            for i, word in enumerate(words):
+                delta = word if i == len(words) - 1 else word + " "
+                event = {"choices": [{"index": 0, "delta": {"content": delta}}]}
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(pause)
+            if (payload.get("stream_options") or {}).get("include_usage"):
+                usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(words)}
+                self.wfile.write(f"data: {json.dumps({'choices': [], 'usage': usage})}\n\n".encode("utf-8"))
+            self.wfile.write(b"data: [DONE]\n\n")
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@contextmanager
+def running(config: MockConfig = None, port: int = 0):
+    """Serve in a background thread; yields the chat-completions URL."""
+    config = config or MockConfig()
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(config))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Mock chat-completions server")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=0.2, help="Seconds per completion")
+    ap.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- seconds added to latency")
+    ap.add_argument("--rate-limit", type=float, default=0.0, help="Requests per second before 429, 0 disables")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    args = ap.parse_args()
+
+    config = MockConfig(args.latency, args.jitter, args.rate_limit, args.error_rate)
+    with running(config, args.port) as url:
+        print(f"[DEBUG] Mock chat completions at {url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,93 @@
 #!/usr/bin/env python3
-import argparse, pathlib, datetime, re, shutil
+import argparse, pathlib, datetime, re, shutil, csv, string
+
+FICLONE = 0x40049409  # Linux ioctl, reflink copy on btrfs/xfs
 
 def slug(s):
     s = re.sub(r"[^A-Za-z0-9]+", "_", s).strip("_")
     return s[:80]
 
+class RunTemplate:
+    """runs/_run_template read once: its file list plus notes.md compiled to a string.Template."""
+
+    def __init__(self, src: pathlib.Path):
+        self.src = src
+        self.files = sorted(p.relative_to(src) for p in src.rglob("*") if p.is_file())
+        self.notes_rel = pathlib.Path("inputs") / "notes.md"
+        text = (src / self.notes_rel).read_text(encoding="utf-8").replace("$", "$$")
+        text = text.replace("Company, ", "Company, ${company}").replace("Role, ", "Role, ${role}")
+        self.notes = string.Template(text)
+
+    def materialize(self, dst: pathlib.Path, company: str, role: str):
+        for rel in self.files:
+            target = dst / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if rel == self.notes_rel:
+                target.write_text(self.notes.substitute(company=company, role=role), encoding="utf-8")
+            else:
+                clone_file(self.src / rel, target)
+
+def clone_file(src: pathlib.Path, dst: pathlib.Path):
+    """Copy-on-write clone where the filesystem supports it, plain copy otherwise.
+
+    Hardlinks are deliberately not used: run files are edited in place, which would
+    write through to the template.
+    """
+    try:
+        import fcntl
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        return
+    except (ImportError, OSError):
+        pass
+    shutil.copyfile(src, dst)
+
+def read_targets(path: pathlib.Path):
+    """Rows from a targets CSV or a markdown table such as config/targets.md."""
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            return [{k.strip(): (v or "").strip() for k, v in row.items()} for row in csv.DictReader(f)]
+    rows, header = [], None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line.startswith("|"):
+            header = None
+            continue
+        cells = [c.strip() for c in line.strip("|").split("|")]
+        if header is None:
+            header = cells
+        elif not all(set(c) <= set(":-") for c in cells):
+            rows.append(dict(zip(header, cells)))
+    return rows
+
+def bulk(base: pathlib.Path, template: RunTemplate, seed: pathlib.Path, role: str, date: str, max_priority=None):
+    """Materialize one run per seed row. Returns (created, skipped existing, number of valid rows)."""
+    created, skipped, valid = [], [], 0
+    for n, row in enumerate(read_targets(seed), 1):
+        company = row.get("Company", "")
+        row_role = row.get("Role title") or role
+        if not company or not row_role:
+            missing = "Company" if not company else "Role title (pass --role for a default)"
+            print(f"[WARN] Skipping {seed.name} row {n}: no {missing}")
+            continue
+        valid += 1
+        if max_priority is not None and row.get("Priority", "").isdigit() and int(row["Priority"]) > max_priority:
+            continue
+        dst = base / "runs" / f"{date}_{slug(company)}_{slug(row_role)}"
+        if dst.exists():
+            skipped.append(dst)
+            continue
+        template.materialize(dst, company, row_role)
+        created.append(dst)
+    return created, skipped, valid
+
 def main():
-    ap = argparse.ArgumentParser(description="Create a new Cassandra run folder")
-    ap.add_argument("--company", required=True, help="Company name")
-    ap.add_argument("--role", required=True, help="Role title")
+    ap = argparse.ArgumentParser(description="Create new Cassandra run folders")
+    ap.add_argument("--company", help="Company name")
+    ap.add_argument("--role", help="Role title, the default for --seed rows without a Role title column")
     ap.add_argument("--date", help="YYYY-MM-DD, defaults to today")
+    ap.add_argument("--seed", help="Create one run per row of a targets CSV or markdown table, e.g. config/targets_seed.csv")
+    ap.add_argument("--max-priority", type=int, help="With --seed, only rows with Priority at or below this")
     args = ap.parse_args()
 
     date = args.date or datetime.date.today().isoformat()
@@ -17,17 +95,24 @@ def main():
     src = base / "runs" / "_run_template"
     if not src.exists():
         raise SystemExit("Template folder runs/_run_template missing")
+    template = RunTemplate(src)
+
+    if args.seed:
+        created, skipped, valid = bulk(base, template, base / args.seed, args.role, date, args.max_priority)
+        for dst in created:
+            print(str(dst))
+        print(f"[DEBUG] Created {len(created)}, skipped {len(skipped)} existing")
+        if not valid:
+            raise SystemExit(f"No usable rows in {args.seed}")
+        return
+
+    if not args.company or not args.role:
+        ap.error("--company and --role are required unless --seed is given")
     folder = f"{date}_{slug(args.company)}_{slug(args.role)}"
     dst = base / "runs" / folder
     if dst.exists():
         raise SystemExit(f"Destination already exists, {dst}")
-    shutil.copytree(src, dst)
-    # write notes
-    notes = (dst / "inputs" / "notes.md")
-    text = notes.read_text(encoding="utf-8")
-    text = text.replace("Company, ", f"Company, {args.company}")
-    text = text.replace("Role, ", f"Role, {args.role}")
-    notes.write_text(text, encoding="utf-8")
+    template.materialize(dst, args.company, args.role)
     print(str(dst))
 
 if __name__ == "__main__":
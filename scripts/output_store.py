@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for generated run outputs.
+
+write_if_changed() hashes an artifact and leaves the file (and its mtime) alone when the
+content is identical, so reruns do not churn result.json or the "latest run" order. Each
+new version is kept once in runs/_store/objects/ by SHA-256 and logged in the run's
+outputs/versions.jsonl. Identical files are stored once however many runs or names
+produce them. The store and the logs are gitignored, so history is local to a clone.
+
+compact removes resume variants in runs/*/outputs/ that are byte-identical to the resume
+the run's result.json names (Resume_Next_Test_65.md ... _72.md next to _73.md). Removed
+names stay logged and restorable from the store. It then drops store objects no log or
+output refers to.
+
+    python3 scripts/output_store.py compact            # show the plan
+    python3 scripts/output_store.py compact --apply
+    python3 scripts/output_store.py log runs/YYYY-MM-DD_Company_Role
+    python3 scripts/output_store.py restore runs/YYYY-MM-DD_Company_Role <sha256> <name>
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+
+STORE_DIR = Path("runs/_store")
+VERSIONS_FILE = "versions.jsonl"
+# Outputs that are bookkeeping rather than artifacts
+UNTRACKED = {VERSIONS_FILE, "trace.jsonl", ".pipeline.json"}
+RESUME_PREFIX = "Gamal_Mensah_Resume_"
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def object_path(sha: str, store: Path = STORE_DIR) -> Path:
+    return Path(store) / "objects" / sha[:2] / sha
+
+
+def put_object(data: bytes, store: Path = STORE_DIR) -> str:
+    """Store data once under its hash. Returns the hash."""
+    sha = digest(data)
+    path = object_path(sha, store)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{sha}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    return sha
+
+
+def log_version(out_dir: Path, name: str, sha: str, size: int, event: str = "write"):
+    entry = {"ts": round(time.time(), 3), "file": name, "sha256": sha, "size": size, "event": event}
+    with open(Path(out_dir) / VERSIONS_FILE, "a", encoding="utf-8", newline="\n") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def history(out_dir: Path, name: str = None) -> list:
+    path = Path(out_dir) / VERSIONS_FILE
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    return [e for e in entries if name is None or e["file"] == name]
+
+
+def write_if_changed(path: Path, data, same=None, store: Path = STORE_DIR) -> bool:
+    """Write data to path unless the file already holds the same content. Returns True if written.
+
+    same(old_bytes, new_bytes) may declare two contents equivalent, e.g. result.json apart
+    from its date.
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        old = path.read_bytes()
+    except OSError:
+        old = None
+    if old is not None and (old == data or (same is not None and same(old, data))):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    record(path, data, store)
+    return True
+
+
+def record(path: Path, data: bytes = None, store: Path = STORE_DIR) -> str:
+    """Store a file written by other means (e.g. streamed) and log it if it is a new version."""
+    path = Path(path)
+    data = path.read_bytes() if data is None else data
+    sha = put_object(data, store)
+    previous = history(path.parent, path.name)
+    if not previous or previous[-1]["sha256"] != sha or previous[-1]["event"] != "write":
+        log_version(path.parent, path.name, sha, len(data))
+    return sha
+
+
+def json_same_except(*keys):
+    """same() for write_if_changed(): JSON documents equal once the given top-level keys are dropped."""
+    def same(old: bytes, new: bytes) -> bool:
+        try:
+            a, b = json.loads(old), json.loads(new)
+        except ValueError:
+            return False
+        if not (isinstance(a, dict) and isinstance(b, dict)):
+            return a == b
+        return {k: v for k, v in a.items() if k not in keys} == {k: v for k, v in b.items() if k not in keys}
+    return same
+
+
+def resolve(prefix: str, store: Path = STORE_DIR) -> str:
+    """Full hash for a hash prefix of at least 4 characters, as printed by the log command."""
+    matches = [p.name for p in (Path(store) / "objects" / prefix[:2]).glob(f"{prefix}*")] if len(prefix) >= 4 else []
+    if len(matches) != 1:
+        raise ValueError(f"{prefix!r} matches {len(matches)} stored objects")
+    return matches[0]
+
+
+def restore(out_dir: Path, sha: str, name: str, store: Path = STORE_DIR) -> Path:
+    data = object_path(resolve(sha, store), store).read_bytes()
+    dest = Path(out_dir) / name
+    write_if_changed(dest, data, store=store)
+    return dest
+
+
+def _outputs(runs_dir: Path):
+    for run in sorted(Path(runs_dir).iterdir()):
+        out = run / "outputs"
+        if run.is_dir() and not run.name.startswith("_") and out.is_dir():
+            yield out
+
+
+def live_resume(out_dir: Path):
+    """Name of the resume build_resume writes for a run, from its result.json, or None."""
+    try:
+        result = json.loads((Path(out_dir) / "result.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if result.get("resume_file"):
+        return result["resume_file"]
+    company = result.get("company")
+    return f"{RESUME_PREFIX}{company.replace(' ', '_')}.md" if company else None
+
+
+def compact(runs_dir: Path = Path("runs"), apply: bool = False, store: Path = STORE_DIR) -> dict:
+    """Fold copies of each run's current resume into it and drop unreferenced objects.
+
+    Only resume markdown files byte-identical to the one result.json names are removed, so
+    the live file is never deleted and other artifacts are never folded into each other.
+    """
+    plan = {"removed": [], "objects_dropped": 0, "bytes_freed": 0}
+    referenced = set()
+    for out in _outputs(runs_dir):
+        shas = {p: digest(p.read_bytes()) for p in sorted(out.iterdir())
+                if p.is_file() and p.name not in UNTRACKED and not p.name.startswith(".")}
+        referenced.update(shas.values())
+        referenced.update(e["sha256"] for e in history(out))
+        keep = out / (live_resume(out) or "")
+        if keep not in shas:
+            continue
+        sha = shas[keep]
+        dupes = [p for p, s in shas.items() if s == sha and p != keep
+                 and p.name.startswith(RESUME_PREFIX) and p.suffix == keep.suffix]
+        if apply and dupes:
+            record(keep, store=store)
+        for p in dupes:
+            plan["removed"].append({"path": p.as_posix(), "kept": keep.name, "sha256": sha})
+            plan["bytes_freed"] += p.stat().st_size
+            if apply:
+                log_version(out, p.name, sha, p.stat().st_size, event="removed")
+                p.unlink()
+
+    objects = Path(store) / "objects"
+    if objects.exists():
+        for obj in objects.glob("*/*"):
+            if obj.name not in referenced and not obj.name.endswith(".tmp"):
+                plan["objects_dropped"] += 1
+                plan["bytes_freed"] += obj.stat().st_size
+                if apply:
+                    obj.unlink()
+    return plan
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Deduplicated store and version log for run outputs")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    c = sub.add_parser("compact", help="Fold identical output variants and drop unreferenced objects")
+    c.add_argument("--runs", default="runs")
+    c.add_argument("--apply", action="store_true", help="Delete files; without it only the plan is printed")
+    lg = sub.add_parser("log", help="Version log of a run's outputs")
+    lg.add_argument("run", help="Run folder")
+    lg.add_argument("--file", help="Only this output file")
+    r = sub.add_parser("restore", help="Write a logged version back into a run's outputs")
+    r.add_argument("run", help="Run folder")
+    r.add_argument("sha256", help="Version hash or a prefix of it")
+    r.add_argument("name", help="File name to restore it as")
+    args = ap.parse_args()
+
+    if args.cmd == "compact":
+        plan = compact(Path(args.runs), args.apply)
+        for item in plan["removed"]:
+            print(f"{'[removed]' if args.apply else '[would remove]'} {item['path']} (same as {item['kept']})")
+        print(f"{len(plan['removed'])} duplicate file(s), {plan['objects_dropped']} unreferenced object(s), "
+              f"{plan['bytes_freed']} bytes {'freed' if args.apply else 'reclaimable'}")
+    elif args.cmd == "log":
+        for e in history(Path(args.run) / "outputs", args.file):
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(e["ts"]))
+            print(f"{stamp} {e['event']:<8} {e['sha256'][:12]} {e['size']:>8} {e['file']}")
+    else:
+        print(f"[DEBUG] Restored {restore(Path(args.run) / 'outputs', args.sha256, args.name)}")
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Generate the full output contract for a run: the resume, cover_letter.md,
+linkedin_summary.md, ats_report.md and follow_up_note.md. The resume slot of the contract
+is the generator's Gamal_Mensah_Resume_<Company>.md; no separate resume.md is written.
+
+Artifacts form a small DAG. Independent LLM-backed artifacts run concurrently,
+ats_report.md starts as soon as the resume exists, and a run takes as long as its critical
+path. Each artifact's input fingerprint (JD, baselines, settings and the outputs it depends
+on) is kept in outputs/.pipeline.json, and unchanged artifacts are skipped.
+
+    python3 scripts/pipeline.py runs/YYYY-MM-DD_Company_Role/inputs/jd.md
+    python3 scripts/pipeline.py --all --workers 4
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import generate_resume_from_jd as gen
+from output_store import write_if_changed
+from tracing import Tracer
+
+
+STATE_FILE = ".pipeline.json"
+SETTINGS_PATH = Path("config/settings.yaml")
+HOOKS_PATH = Path("includes/cover_letter_hooks.md")
+FOLLOW_UP_PATH = Path("includes/snippets/follow_up.md")
+FOLLOW_UP_WORDS = (60, 90)  # README output contract
+
+
+class Node:
+    def __init__(self, name: str, fn, deps: tuple = (), llm: bool = False):
+        self.name = name
+        self.fn = fn
+        self.deps = deps
+        self.llm = llm
+
+
+def read_settings(path: Path = SETTINGS_PATH) -> dict:
+    if not Path(path).exists():
+        return {}
+    from check_banned_chars import load_settings
+
+    return load_settings(path)
+
+
+def ats_report_md(jd_text: str, resume_text: str, df_index, goal=None) -> tuple:
+    """ats_report.md for a resume against a JD. Returns (markdown, coverage percent)."""
+    from ats_coverage import coverage, select_target
+
+    pct, present, missing = coverage(set(), set(), resume_text, select_target(jd_text, df_index))
+    # markdown rules and list markers tokenize as terms; they are not worth placing
+    missing = [t for t in missing if all(any(c.isalnum() for c in w) for w in t.split())]
+    lines = ["# ATS Report", "", f"Coverage: {pct} percent" + (f" (target {goal})" if goal else ""), ""]
+    lines.append("## Missing terms")
+    lines.extend(f"- {t}" for t in missing[:40])
+    lines.extend(["", "## Placements"])
+    lines.extend(f"- Summary: {t}" for t in missing[:5])
+    lines.extend(f"- Experience bullets: {t}" for t in missing[5:15])
+    lines.append("")
+    return "\n".join(lines), pct
+
+
+def run_dag(nodes: list, workers: int = 4, tracer: Tracer = None) -> dict:
+    """Run nodes as soon as their deps finish. Returns {name: result or exception}.
+
+    A node whose dependency failed is not run; its result is that dependency's exception.
+    """
+    tracer = tracer or Tracer()
+    by_name = {n.name: n for n in nodes}
+    results, running = {}, {}
+
+    def call(node):
+        with tracer.span(f"pipeline.{node.name}"):
+            return node.fn({d: results[d] for d in node.deps})
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while len(results) < len(nodes):
+            for node in nodes:
+                if node.name in results or node.name in running:
+                    continue
+                if not all(d in results for d in node.deps):
+                    continue
+                failed = [results[d] for d in node.deps if isinstance(results[d], Exception)]
+                if failed:
+                    results[node.name] = failed[0]
+                else:
+                    running[node.name] = pool.submit(call, node)
+            if not running:
+                if len(results) < len(nodes):
+                    missing = sorted(set(by_name) - set(results))
+                    raise ValueError(f"Unresolvable dependencies for: {', '.join(missing)}")
+                break
+            done, _ = wait(running.values(), return_when=FIRST_COMPLETED)
+            for name, fut in list(running.items()):
+                if fut in done:
+                    del running[name]
+                    try:
+                        results[name] = fut.result()
+                    except Exception as e:
+                        results[name] = e
+    return results
+
+
+def _digest(*parts) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else json.dumps(part, sort_keys=True).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else ""
+
+
+def _word_range(settings: dict, section: str, lo: str, hi: str, default: tuple) -> tuple:
+    s = settings.get(section, {})
+    return s.get(lo, default[0]), s.get(hi, default[1])
+
+
+def _llm_text(prompt: str, name: str, client, tracer: Tracer, max_tokens: int = 500) -> str:
+    payload = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": prompt}], "max_tokens": max_tokens}
+    return gen.sanitize_text(gen.complete(payload, name, client, gen.CACHE, tracer).strip())
+
+
+class RunPipeline:
+    """The DAG for one run folder."""
+
+    def __init__(self, jd_path: Path, baselines: dict, client=None, tracer: Tracer = None,
+                 max_workers: int = gen.MAX_WORKERS, bullets: str = None, force: bool = False, settings: dict = None):
+        self.jd_path = Path(jd_path)
+        self.baselines = baselines
+        self.client = client
+        self.tracer = tracer or Tracer()
+        self.max_workers = max_workers
+        self.bullets = bullets
+        self.force = force
+        self.settings = settings or {}
+        self.out_dir = self.jd_path.parent.parent / "outputs"
+        self.state_path = self.out_dir / STATE_FILE
+        header = gen.parse_jd_header(self.jd_path)
+        folder = self.jd_path.parent.parent.name
+        self.company = gen.sanitize_text(header.get("company", folder))
+        self.job_title = gen.sanitize_text(header.get("job_title", self.company.replace("_", " ")))
+        self.jd_text = self.jd_path.read_text(encoding="utf-8")
+        self.base_inputs = _digest(self.jd_text.encode("utf-8"), baselines, self.settings)
+        try:
+            self.state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.state = {}
+        self.ran, self.skipped = [], []
+
+    def nodes(self) -> list:
+        return [
+            Node("resume.md", self.resume, llm=True),
+            Node("cover_letter.md", self.cover_letter, llm=True),
+            Node("linkedin_summary.md", self.linkedin_summary, llm=True),
+            Node("follow_up_note.md", self.follow_up_note, llm=True),
+            Node("ats_report.md", self.ats_report, deps=("resume.md",)),
+        ]
+
+    def artifact_path(self, name: str) -> Path:
+        """File holding an artifact; it differs from the name when the artifact's builder names it."""
+        return self.out_dir / self.state.get(name, {}).get("path", name)
+
+    def _cached(self, name: str, fingerprint: str, llm: bool):
+        """Output digest of an artifact that can be reused, or None."""
+        entry = self.state.get(name, {})
+        path = self.artifact_path(name)
+        if self.force or entry.get("inputs") != fingerprint or not path.exists():
+            return None
+        if llm and entry.get("fallback") and gen.OPENAI_API_KEY:
+            return None  # redo offline fallbacks once an API key is available
+        digest = _file_digest(path)
+        return digest if digest == entry.get("output") else None
+
+    def _artifact(self, name: str, deps: dict, build, llm: bool = False) -> str:
+        fingerprint = _digest(self.base_inputs, name, deps)
+        digest = self._cached(name, fingerprint, llm)
+        if digest:
+            self.skipped.append(name)
+            return digest
+        out, fallback = build()
+        if isinstance(out, Path):
+            path = out  # already written by the builder under its own name
+        else:
+            path = self.out_dir / name
+            write_if_changed(path, out)
+        digest = _file_digest(path)
+        self.state[name] = {"inputs": fingerprint, "output": digest, "fallback": fallback}
+        if path.name != name:
+            self.state[name]["path"] = path.name
+        self.ran.append(name)
+        return digest
+
+    def _llm_or(self, name: str, prompt: str, fallback):
+        try:
+            return _llm_text(prompt, f"generate_{name}", self.client, self.tracer), False
+        except Exception as e:
+            print(f"[WARN] {name} falling back to includes/ text: {e}")
+            return fallback(), True
+
+    def _context(self) -> str:
+        summary = " ".join(self.baselines.get("summary", []))
+        return f"Candidate summary: {summary}\n\nJob description:\n{self.jd_text[:6000]}"
+
+    def resume(self, deps: dict) -> str:
+        mode = self.bullets or gen.BULLETS
+
+        def build():
+            md_file, result = gen.build_resume(self.jd_path, self.baselines, self.max_workers, client=self.client,
+                                               digest=gen.input_hash(self.jd_path, self.baselines, mode),
+                                               tracer=self.tracer, bullets=mode)
+            return md_file, mode == "llm" and not gen.OPENAI_API_KEY
+
+        return self._artifact("resume.md", dict(deps, bullets=mode), build, llm=True)
+
+    def cover_letter(self, deps: dict) -> str:
+        lo, hi = _word_range(self.settings, "cover_letter", "word_count_min", "word_count_max", (180, 220))
+
+        def fallback():
+            from includes_index import parse_sections
+
+            sections = parse_sections(HOOKS_PATH.read_text(encoding="utf-8")) if HOOKS_PATH.exists() else {}
+            hook = next((v[0] for k, v in sections.items() if k.startswith("ten first")), "")
+            cta = next((v[0] for k, v in sections.items() if k.startswith("ten cta")), "")
+            body = " ".join(self.baselines.get("summary", []))
+            # hooks and calls to action are numbered list items; the summary is used as is
+            hook, cta = (re.sub(r"^\d+\.\s*", "", p) for p in (hook, cta))
+            return "\n\n".join(p for p in (hook, body, cta) if p)
+
+        prompt = (f"Write a cover letter of {lo} to {hi} words for the role '{self.job_title}' at {self.company}. "
+                  "Open with a one-line hook, include one link at most and end with one clear call to action. "
+                  f"Return only the letter.\n\n{self._context()}")
+        return self._artifact("cover_letter.md", deps,
+                              lambda: self._wrap("Cover Letter", *self._llm_or("cover_letter", prompt, fallback)),
+                              llm=True)
+
+    def linkedin_summary(self, deps: dict) -> str:
+        lo, hi = _word_range(self.settings, "linkedin", "summary_min", "summary_max", (120, 180))
+
+        def fallback():
+            bullets = [b for role in self.baselines.get("experience", {}).values() for b in role.get("bullets", [])]
+            lines = [" ".join(self.baselines.get("summary", []))]
+            lines.extend(f"- {gen.sanitize_text(b)}" for b in bullets[:3])
+            return "\n".join(lines)
+
+        prompt = (f"Write a LinkedIn About summary of {lo} to {hi} words aimed at '{self.job_title}' roles like "
+                  f"the one at {self.company}. Start with a one-line hook, then three outcome bullets. "
+                  f"Return only the summary.\n\n{self._context()}")
+        return self._artifact("linkedin_summary.md", deps,
+                              lambda: self._wrap("LinkedIn Summary", *self._llm_or("linkedin_summary", prompt, fallback)),
+                              llm=True)
+
+    def follow_up_note(self, deps: dict) -> str:
+        lo, hi = FOLLOW_UP_WORDS
+
+        def fallback():
+            lines = FOLLOW_UP_PATH.read_text(encoding="utf-8").splitlines() if FOLLOW_UP_PATH.exists() else []
+            text = "\n".join(l for l in lines if not l.startswith("#")).strip()
+            return text.replace("[Role]", f"{self.job_title} role at {self.company}")
+
+        prompt = (f"Write a follow-up note of {lo} to {hi} words to a recruiter or hiring manager after applying "
+                  f"for '{self.job_title}' at {self.company}. Return only the note.\n\n{self._context()}")
+        return self._artifact("follow_up_note.md", deps,
+                              lambda: self._wrap("Follow-up Note", *self._llm_or("follow_up_note", prompt, fallback)),
+                              llm=True)
+
+    def ats_report(self, deps: dict) -> str:
+        def build():
+            from jd_corpus import load_corpus_index
+
+            df_index = load_corpus_index(str(self.jd_path.parent.parent.parent))
+            resume = self.artifact_path("resume.md").read_text(encoding="utf-8")
+            goal = self.settings.get("ats", {}).get("coverage_target_percent")
+            return ats_report_md(self.jd_text, resume, df_index, goal)[0], False
+
+        return self._artifact("ats_report.md", deps, build)
+
+    @staticmethod
+    def _wrap(title: str, text: str, fallback: bool):
+        return f"# {title}\n\n{text.strip()}\n", fallback
+
+    def run(self, workers: int = 4) -> dict:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        results = run_dag(self.nodes(), workers, self.tracer)
+        with open(self.state_path, "w", encoding="utf-8", newline="\n") as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        return results
+
+
+def run_pipeline(jd_path: Path, baselines: dict, client=None, workers: int = 4, force: bool = False,
+                 bullets: str = None) -> dict:
+    settings = read_settings()
+    t0 = time.perf_counter()
+    pipe = RunPipeline(jd_path, baselines, client, max_workers=gen.MAX_WORKERS, bullets=bullets, force=force,
+                       settings=settings)
+    results = pipe.run(workers)
+    ms = (time.perf_counter() - t0) * 1000
+    errors = {k: v for k, v in results.items() if isinstance(v, Exception)}
+    names = {f"pipeline.{n.name}" for n in pipe.nodes()}
+    stages = {r["name"]: r["duration_ms"] for r in pipe.tracer.spans if r["name"] in names}
+    print(f"[pipeline] {jd_path.parent.parent.name}: built {len(pipe.ran)}, skipped {len(pipe.skipped)}, "
+          f"{len(errors)} failed in {ms:.0f} ms (sum of stages {sum(stages.values()):.0f} ms)")
+    for name, err in errors.items():
+        print(f"[WARN] {name} failed: {err}")
+    return results
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Generate every output contract artifact for a run")
+    ap.add_argument("jd_path", nargs="?", help="Path to runs/.../inputs/jd.md")
+    ap.add_argument("--all", action="store_true", help="Every runs/*/inputs/jd.md")
+    ap.add_argument("--runs", default="runs", help="Runs directory for --all")
+    ap.add_argument("--workers", type=int, default=4, help="Artifacts generated in parallel per run")
+    ap.add_argument("--force", action="store_true", help="Rebuild artifacts even if their inputs are unchanged")
+    ap.add_argument("--bullets", choices=["llm", "offline"], default=gen.BULLETS,
+                    help="Resume bullet source (also CASSANDRA_BULLETS)")
+    args = ap.parse_args()
+    if not args.all and not args.jd_path:
+        ap.error("jd_path is required unless --all is given")
+    baselines = gen.load_baselines()
+    jds = gen.discover_jds(args.runs) if args.all else [Path(args.jd_path)]
+    session = gen.make_session(args.workers * gen.MAX_WORKERS)
+    client = gen.make_client(session, args.workers * gen.MAX_WORKERS)
+    failed = False
+    try:
+        for jd in jds:
+            results = run_pipeline(jd, baselines, client, args.workers, args.force, args.bullets)
+            failed |= any(isinstance(v, Exception) for v in results.values())
+    finally:
+        session.close()
+    raise SystemExit(1 if failed else 0)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Compile the context bundle listed in project_index.yaml: the master prompt, then each
+include in index order, then the run's JD.
+
+Static material comes first and in a stable order, so two requests that differ only in the
+JD share the longest possible prefix for provider-side prompt caching. The static part is
+cached in .cache/prompt_bundle/ under a key made of every source file's hash, so a rebuild
+after a JD change reads and hashes files but does not re-assemble them. --budget trims
+includes from the end of the index until the estimated tokens fit, which also keeps the
+prefix stable.
+
+    python3 scripts/prompt_bundle.py --jd runs/YYYY-MM-DD_Company_Role/inputs/jd.md --budget 6000
+    python3 scripts/prompt_bundle.py --stats
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+
+INDEX_PATH = Path("project_index.yaml")
+CACHE_DIR = Path(".cache/prompt_bundle")
+CHARS_PER_TOKEN = 4  # rough estimate for English prose
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def load_project_index(path: Path = INDEX_PATH) -> dict:
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def section_text(path: str, body: str) -> str:
+    return f"<!-- file: {path} -->\n{body.rstrip()}\n"
+
+
+class Bundle:
+    def __init__(self, sections: list, key: str):
+        self.sections = sections  # [{"path", "sha256", "tokens", "text", "static"}]
+        self.key = key
+
+    @property
+    def text(self) -> str:
+        return "\n".join(s["text"] for s in self.sections)
+
+    @property
+    def tokens(self) -> int:
+        return sum(s["tokens"] for s in self.sections)
+
+    def with_jd(self, jd_path: Path) -> "Bundle":
+        body = Path(jd_path).read_text(encoding="utf-8")
+        text = section_text(Path(jd_path).as_posix(), body)
+        jd = {"path": Path(jd_path).as_posix(), "sha256": hashlib.sha256(body.encode("utf-8")).hexdigest(),
+              "tokens": estimate_tokens(text), "text": text, "static": False}
+        return Bundle(self.sections + [jd], self.key)
+
+    def trimmed(self, budget: int) -> "Bundle":
+        """Drop includes from the end of the index until the estimated tokens fit budget.
+
+        The master prompt (first section) and non-static sections such as the JD are always kept.
+        """
+        keep = list(self.sections)
+        total = self.tokens
+        for s in reversed(self.sections[1:]):
+            if total <= budget:
+                break
+            if s["static"]:
+                keep.remove(s)
+                total -= s["tokens"]
+        if total > budget:
+            print(f"[WARN] Required sections need {total} tokens, over the {budget} budget", file=sys.stderr)
+        return Bundle(keep, self.key)
+
+    def stats(self) -> list:
+        return [{"path": s["path"], "tokens": s["tokens"], "static": s["static"]} for s in self.sections]
+
+
+def source_paths(index: dict) -> list:
+    paths = [index["prompt"]] if index.get("prompt") else []
+    paths.extend(p for p in index.get("includes", []) if p not in paths)
+    return paths
+
+
+def compile_bundle(index_path: Path = INDEX_PATH, cache_dir: Path = CACHE_DIR, base: Path = Path(".")) -> Bundle:
+    """Static sections for the index, served from the cache when no source file changed."""
+    index_path = Path(index_path)
+    sources = []
+    for rel in source_paths(load_project_index(index_path)):
+        path = base / rel
+        if not path.exists():
+            print(f"[WARN] {rel} listed in {index_path} does not exist", file=sys.stderr)
+            continue
+        data = path.read_bytes()
+        sources.append((rel, hashlib.sha256(data).hexdigest(), data))
+    key = hashlib.sha256(json.dumps([(rel, digest) for rel, digest, _ in sources]).encode("utf-8")).hexdigest()
+
+    cache_file = Path(cache_dir) / f"{key[:32]}.json"
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return Bundle(json.load(f)["sections"], key)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    sections = []
+    for rel, digest, data in sources:
+        text = section_text(rel, data.decode("utf-8", errors="replace"))
+        sections.append({"path": rel, "sha256": digest, "tokens": estimate_tokens(text), "text": text, "static": True})
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"sections": sections}, f)
+    tmp.replace(cache_file)
+    return Bundle(sections, key)
+
+
+def build(jd_path: Path = None, budget: int = None, index_path: Path = INDEX_PATH) -> Bundle:
+    bundle = compile_bundle(index_path)
+    if jd_path:
+        bundle = bundle.with_jd(jd_path)
+    if budget:
+        bundle = bundle.trimmed(budget)
+    return bundle
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Assemble the prompt bundle from project_index.yaml")
+    ap.add_argument("--index", default=str(INDEX_PATH), help="Project index to resolve")
+    ap.add_argument("--jd", help="Append this run's JD after the static sections")
+    ap.add_argument("--budget", type=int, help="Trim includes until the estimated tokens fit")
+    ap.add_argument("--out", help="Write the bundle to this file instead of stdout")
+    ap.add_argument("--stats", action="store_true", help="Print per-section token estimates instead of the bundle")
+    args = ap.parse_args()
+    bundle = build(Path(args.jd) if args.jd else None, args.budget, Path(args.index))
+    if args.stats:
+        print(json.dumps({"key": bundle.key, "tokens": bundle.tokens, "sections": bundle.stats()}, indent=2))
+    elif args.out:
+        Path(args.out).write_text(bundle.text, encoding="utf-8")
+        print(f"Wrote {args.out} ({bundle.tokens} tokens est., {len(bundle.sections)} sections)")
+    else:
+        sys.stdout.write(bundle.text)
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
-import argparse, pathlib, re, json, sys
+import argparse, pathlib, json, sys
+
+from includes_index import load_index
 
 OVERLAYS = {
     "cpg": "includes/overlays/cpg.md",
@@ -10,33 +12,16 @@ OVERLAYS = {
     "saas": "includes/overlays/saas.md",
 }
 
-def pick_overlay(base: pathlib.Path, domain: str) -> dict:
-    p = base / OVERLAYS[domain]
-    text = p.read_text(encoding="utf-8")
-    # naive parsing
-    headline = re.findall(r"## Headline options\n((?:- .+\n)+)", text)[0].strip().splitlines()
-    summary = re.findall(r"## Summary starters\n((?:- .+\n)+)", text)[0].strip().splitlines()
-    core = re.findall(r"## Core Skills\n(.+)", text)[0].split(",")
-    return {
-        "headline": [h[2:] for h in headline],
-        "summary": [s[2:] for s in summary],
-        "core": [c.strip() for c in core]
-    }
-
-def main():
-    ap = argparse.ArgumentParser(description="Create an MTO pack in a run folder")
-    ap.add_argument("run_path", help="Path to runs/YYYY-MM-DD_Company_Role")
-    ap.add_argument("--domain", required=True, choices=list(OVERLAYS.keys()), help="Domain overlay to use")
-    args = ap.parse_args()
-
-    base = pathlib.Path(__file__).resolve().parents[1]
-    run = (base / args.run_path).resolve()
-    if not run.exists():
-        raise SystemExit(f"Run folder not found, {run}")
-    overlay = pick_overlay(base, args.domain)
+def pick_overlay(base: pathlib.Path, domain: str, index: dict = None) -> dict:
+    index = index or load_index(base)
+    overlay = index["overlays"].get(pathlib.Path(OVERLAYS[domain]).stem)
+    if not overlay or not overlay["headline"]:
+        raise SystemExit(f"Overlay {OVERLAYS[domain]} is missing a Headline options list")
+    return overlay
 
-    out = run / "outputs" / "mto_pack.md"
-    content = f"# MTO pack, {args.domain}\n\n"
+def write_pack(run: pathlib.Path, domain: str, overlay: dict, filename: str = "mto_pack.md") -> pathlib.Path:
+    out = run / "outputs" / filename
+    content = f"# MTO pack, {domain}\n\n"
     content += "## Headline\n" + overlay["headline"][0] + "\n\n"
     content += "## Summary\n- " + "\n- ".join(overlay["summary"]) + "\n\n"
     content += "## Three bullets\n"
@@ -47,7 +32,27 @@ def main():
     content += "## Core Skills\n" + ", ".join(overlay["core"][:10]) + "\n\n"
     content += "## Next\n- Paste two must have JD terms into the Summary.\n- Swap nouns to match the JD.\n- Export and submit.\n"
     out.write_text(content, encoding="utf-8")
-    print(str(out))
+    return out
+
+def main():
+    ap = argparse.ArgumentParser(description="Create MTO packs in one or more run folders")
+    ap.add_argument("run_path", nargs="+", help="Path(s) to runs/YYYY-MM-DD_Company_Role")
+    ap.add_argument("--domain", required=True, nargs="+", choices=list(OVERLAYS.keys()),
+                    help="Domain overlay(s) to use; several write mto_pack_<domain>.md each")
+    args = ap.parse_args()
+
+    base = pathlib.Path(__file__).resolve().parents[1]
+    runs = [(base / p).resolve() for p in args.run_path]
+    for run in runs:
+        if not run.exists():
+            raise SystemExit(f"Run folder not found, {run}")
+    index = load_index(base)
+    overlays = {d: pick_overlay(base, d, index) for d in args.domain}
+
+    for run in runs:
+        for domain, overlay in overlays.items():
+            filename = "mto_pack.md" if len(overlays) == 1 else f"mto_pack_{domain}.md"
+            print(str(write_pack(run, domain, overlay, filename)))
 
 if __name__ == "__main__":
     main()
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
+import argparse
 import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
 from docx import Document
 
+TEMPLATE_PATH = "templates/Resume_Template_Cassandra_v3.1.docx"
+
 def load_baseline(path="data/baseline_resume.json"):
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def render_resume(output_path: str, baseline: dict, tailoring: dict):
-    doc = Document()
-
+def _fill(doc, baseline: dict, tailoring: dict, style=lambda name: name):
+    """Write resume content into doc. style() maps a style name to one the document has."""
     # Header
     doc.add_heading(baseline["header"]["name"], 0)
     doc.add_paragraph(f"{baseline['header']['city']} | {baseline['header']['email']}")
@@ -31,10 +38,10 @@ def render_resume(output_path: str, baseline: dict, tailoring: dict):
     doc.add_heading("Experience", level=1)
     for role in baseline["experience"]:
         title_line = f"{role['title']} | {role['company']} | {role['location']} | {role['start_date']} – {role['end_date']}"
-        doc.add_paragraph(title_line, style="Intense Quote")
+        doc.add_paragraph(title_line, style=style("Intense Quote"))
         doc.add_paragraph(role["impact"])
         for b in role["bullets"]:
-            doc.add_paragraph(f"• {b}", style="List Bullet")
+            doc.add_paragraph(f"• {b}", style=style("List Bullet"))
 
     # Education
     doc.add_heading("Education & Certifications", level=1)
@@ -46,4 +53,86 @@ def render_resume(output_path: str, baseline: dict, tailoring: dict):
     doc.add_heading("ATS Score", level=1)
     doc.add_paragraph(str(tailoring.get("ats_score", "")))
 
+def render_resume(output_path: str, baseline: dict, tailoring: dict):
+    doc = Document()
+    _fill(doc, baseline, tailoring)
     doc.save(output_path)
+
+class TemplateRenderer:
+    """Parses the authoritative template once and reuses it for every render.
+
+    Each render clears the body (keeping page setup), fills it, and saves, so styles,
+    margins and headers come from the template without re-reading the file.
+    """
+
+    def __init__(self, template_path: str = TEMPLATE_PATH):
+        self.doc = Document(template_path)
+        self._styles = {s.name for s in self.doc.styles}
+
+    def _style(self, name):
+        return name if name in self._styles else None
+
+    def render(self, output_path: str, baseline: dict, tailoring: dict):
+        body = self.doc.element.body
+        sect_pr = body.sectPr
+        for child in list(body):
+            if child is not sect_pr:
+                body.remove(child)
+        _fill(self.doc, baseline, tailoring, self._style)
+        self.doc.save(output_path)
+
+@lru_cache(maxsize=4)
+def get_renderer(template_path: str = TEMPLATE_PATH) -> TemplateRenderer:
+    return TemplateRenderer(template_path)
+
+def render_from_template(output_path: str, baseline: dict, tailoring: dict, template_path: str = TEMPLATE_PATH):
+    get_renderer(template_path).render(output_path, baseline, tailoring)
+
+def _render_job(job):
+    output_path, baseline, tailoring, template_path = job
+    render_from_template(output_path, baseline, tailoring, template_path)
+    return output_path
+
+def render_batch(jobs, template_path: str = TEMPLATE_PATH, workers: int = 0):
+    """Render many (output_path, baseline, tailoring) jobs; workers > 1 uses a process pool,
+    each process parsing the template once."""
+    jobs = [(str(out), baseline, tailoring, template_path) for out, baseline, tailoring in jobs]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_render_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    return [_render_job(job) for job in jobs]
+
+def run_jobs(runs_dir: str, baseline: dict):
+    """One DOCX per run with a result.json, named per includes/filenames.md.
+
+    outputs/tailoring.json, when present, overrides headline, summary and core skills.
+    """
+    jobs = []
+    for result_path in sorted(Path(runs_dir).glob("*/outputs/result.json")):
+        with open(result_path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+        tailoring = {"ats_score": result.get("ats_score", "")}
+        tailoring_path = result_path.parent / "tailoring.json"
+        if tailoring_path.exists():
+            with open(tailoring_path, "r", encoding="utf-8") as f:
+                tailoring.update(json.load(f))
+        company = re.sub(r"[^A-Za-z0-9]+", "", result.get("company", "")) or result_path.parent.parent.name
+        lastname = baseline["header"]["name"].split()[-1]
+        name = f"{lastname}_Resume_{company}_v3.1_{result.get('date', '')}.docx"
+        jobs.append((result_path.parent / name, baseline, tailoring))
+    return jobs
+
+def main():
+    ap = argparse.ArgumentParser(description="Render resumes to DOCX from the authoritative template")
+    ap.add_argument("--runs", default="runs", help="Render one DOCX into each runs/*/outputs with a result.json")
+    ap.add_argument("--baseline", default="data/baseline_resume.json", help="Baseline resume JSON")
+    ap.add_argument("--template", default=TEMPLATE_PATH, help="DOCX template")
+    ap.add_argument("--workers", type=int, default=0, help="Render in a process pool of this size")
+    args = ap.parse_args()
+
+    jobs = run_jobs(args.runs, load_baseline(args.baseline))
+    for out in render_batch(jobs, args.template, args.workers):
+        print(out)
+
+if __name__ == "__main__":
+    main()
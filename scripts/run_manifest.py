@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+SQLite index of every result.json written under runs/.
+build_resume records each run as it writes result.json, so "latest", "since date" and
+aggregate lookups hit an indexed table instead of globbing and stat-ing the runs tree.
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+
+MANIFEST_PATH = "runs/manifest.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    result_path  TEXT PRIMARY KEY,
+    run_folder   TEXT NOT NULL,
+    written_at   REAL NOT NULL,
+    date         TEXT,
+    company      TEXT,
+    job_title    TEXT,
+    ats_score    TEXT,
+    content_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_written_at ON runs (written_at);
+CREATE INDEX IF NOT EXISTS runs_date ON runs (date);
+"""
+
+COLUMNS = ["result_path", "run_folder", "written_at", "date", "company", "job_title", "ats_score", "content_hash"]
+
+
+def connect(path: str = MANIFEST_PATH) -> sqlite3.Connection:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def record_result(result_path, result: dict, written_at: float = None, path: str = MANIFEST_PATH):
+    """Upsert one run. Called right after result.json is written."""
+    result_path = Path(result_path)
+    row = (
+        result_path.as_posix(),
+        result_path.parent.parent.name,
+        written_at if written_at is not None else time.time(),
+        result.get("date", ""),
+        result.get("company", ""),
+        result.get("job_title", ""),
+        str(result.get("ats_score", "")),
+        hashlib.sha256(result_path.read_bytes()).hexdigest(),
+    )
+    with connect(path) as conn:
+        conn.execute(f"INSERT OR REPLACE INTO runs ({', '.join(COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+    conn.close()
+
+
+def prune(paths=None, path: str = MANIFEST_PATH) -> int:
+    """Drop rows whose result.json no longer exists (run deleted or renamed). Returns rows dropped.
+
+    paths limits the check to those result paths; by default every row is checked.
+    """
+    conn = connect(path)
+    try:
+        if paths is None:
+            paths = [r[0] for r in conn.execute("SELECT result_path FROM runs")]
+        dead = [(p,) for p in paths if not Path(p).exists()]
+        with conn:
+            conn.executemany("DELETE FROM runs WHERE result_path = ?", dead)
+    finally:
+        conn.close()
+    return len(dead)
+
+
+def _index(result_paths, path: str = MANIFEST_PATH) -> int:
+    count = 0
+    for result_path in result_paths:
+        try:
+            with open(result_path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Skipping unreadable {result_path}: {e}")
+            continue
+        record_result(result_path, result, written_at=result_path.stat().st_mtime, path=path)
+        count += 1
+    return count
+
+
+def rebuild(runs_dir: str = "runs", path: str = MANIFEST_PATH) -> int:
+    """One-off crawl to (re)populate the manifest from existing result.json files."""
+    prune(path=path)
+    return _index(sorted(Path(runs_dir).glob("*/outputs/result.json")), path=path)
+
+
+def reconcile(runs_dir: str = "runs", path: str = MANIFEST_PATH) -> int:
+    """Index result.json files on disk that the manifest lacks, e.g. committed runs on a fresh clone.
+
+    Rows already present are left alone. Returns how many were added.
+    """
+    conn = connect(path)
+    try:
+        indexed = {r[0] for r in conn.execute("SELECT result_path FROM runs")}
+    finally:
+        conn.close()
+    missing = [p for p in sorted(Path(runs_dir).glob("*/outputs/result.json")) if p.as_posix() not in indexed]
+    return _index(missing, path=path)
+
+
+def _query(sql: str, args=(), path: str = MANIFEST_PATH):
+    conn = connect(path)
+    try:
+        return [dict(r) for r in conn.execute(sql, args)]
+    finally:
+        conn.close()
+
+
+def has_result(result_path, path: str = MANIFEST_PATH) -> bool:
+    return bool(_query("SELECT 1 FROM runs WHERE result_path = ?", (Path(result_path).as_posix(),), path=path))
+
+
+def latest(path: str = MANIFEST_PATH):
+    """Most recently written run whose result.json still exists; rows for missing files are pruned.
+
+    Reads rows newest first off the written_at index and stops at the first live one.
+    """
+    conn = connect(path)
+    try:
+        found, dead = None, []
+        for row in conn.execute("SELECT * FROM runs ORDER BY written_at DESC"):
+            if Path(row["result_path"]).exists():
+                found = dict(row)
+                break
+            dead.append((row["result_path"],))
+        if dead:
+            with conn:
+                conn.executemany("DELETE FROM runs WHERE result_path = ?", dead)
+    finally:
+        conn.close()
+    return found
+
+
+def since(date: str, path: str = MANIFEST_PATH):
+    """Runs whose result date is on or after date (YYYY-MM-DD), oldest first. Missing files are skipped."""
+    rows = _query("SELECT * FROM runs WHERE date >= ? ORDER BY date, written_at", (date,), path=path)
+    return [r for r in rows if Path(r["result_path"]).exists()]
+
+
+def stats(path: str = MANIFEST_PATH) -> dict:
+    rows = _query(
+        """SELECT COUNT(*) AS runs, COUNT(DISTINCT company) AS companies,
+                  MIN(date) AS first_date, MAX(date) AS last_date,
+                  AVG(CASE WHEN ats_score GLOB '[0-9]*' THEN CAST(ats_score AS REAL) END) AS avg_ats_score
+           FROM runs""",
+        path=path,
+    )
+    return rows[0]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Query the run manifest")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("latest", help="Most recently written result.json")
+    p_since = sub.add_parser("since", help="Runs dated on or after a day")
+    p_since.add_argument("date", help="YYYY-MM-DD")
+    sub.add_parser("stats", help="Aggregate counts and average ATS score")
+    p_rebuild = sub.add_parser("rebuild", help="Re-index existing runs/*/outputs/result.json")
+    p_rebuild.add_argument("--runs", default="runs", help="Runs folder, defaults to runs")
+    sub.add_parser("prune", help="Drop rows whose result.json no longer exists")
+    args = ap.parse_args()
+
+    if args.cmd == "latest":
+        out = latest()
+    elif args.cmd == "since":
+        out = since(args.date)
+    elif args.cmd == "stats":
+        out = stats()
+    elif args.cmd == "prune":
+        out = {"pruned": prune()}
+    else:
+        out = {"indexed": rebuild(args.runs)}
+    json.dump(out, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
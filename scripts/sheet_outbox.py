@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Local outbox for Google Sheets rows.
+Every result.json under runs/ is indexed into the run manifest and queued once under its run's JD path;
+sync() sends everything unsynced in chunked values().append calls and marks rows as
+acknowledged so reruns never duplicate them in the sheet.
+
+Acknowledgements live in the gitignored manifest, so until a clone has acknowledged
+anything, sync() first reads the sheet and acknowledges the runs already in it.
+"""
+
+import hashlib
+import json
+import time
+
+import run_manifest
+
+
+SHEET_RANGE = "Sheet1!A:G"  # 7 fixed columns
+CHUNK_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sheet_rows (
+    row_key     TEXT PRIMARY KEY,
+    result_path TEXT NOT NULL,
+    row_json    TEXT NOT NULL,
+    queued_at   REAL NOT NULL,
+    synced_at   REAL
+);
+CREATE INDEX IF NOT EXISTS sheet_rows_synced_at ON sheet_rows (synced_at);
+"""
+
+
+def result_row(result: dict) -> list:
+    """Strict 7-column row, always in sheet header order."""
+    return [
+        result.get("date", ""),          # Date
+        result.get("company", ""),       # Company
+        result.get("job_title", ""),     # Job Title
+        result.get("jd_path", ""),       # JD Path
+        result.get("closing_date", ""),  # Closing Date
+        result.get("jd_url", ""),        # JD URL
+        result.get("ats_score", ""),     # ATS Score
+    ]
+
+
+def row_key(row: list) -> str:
+    """Run identity of a row: its JD path, or a content hash for rows without one."""
+    if len(row) > 3 and row[3]:
+        return str(row[3])
+    return hashlib.sha256(json.dumps(row, ensure_ascii=True).encode("utf-8")).hexdigest()
+
+
+def sheet_keys(service, sheet_id: str) -> set:
+    """Keys of the rows already in the sheet."""
+    resp = service.spreadsheets().values().get(spreadsheetId=sheet_id, range=SHEET_RANGE).execute()
+    return {row_key(r) for r in resp.get("values", [])}
+
+
+def connect(path: str = run_manifest.MANIFEST_PATH):
+    conn = run_manifest.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def mark_synced(result_path, row: list, path: str = run_manifest.MANIFEST_PATH):
+    """Record a row appended outside sync(), e.g. by the single-row update_sheet()."""
+    now = time.time()
+    conn = connect(path)
+    with conn:
+        conn.execute(
+            "INSERT INTO sheet_rows VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(row_key) DO UPDATE SET synced_at = excluded.synced_at",
+            (row_key(row), str(result_path), json.dumps(row), now, now),
+        )
+    conn.close()
+
+
+def collect(path: str = run_manifest.MANIFEST_PATH, runs_dir: str = "runs") -> int:
+    """Queue rows for every result.json in the manifest. Returns how many were new.
+
+    result.json files on disk that the gitignored manifest lacks are indexed first.
+    """
+    run_manifest.reconcile(runs_dir, path=path)
+    conn = connect(path)
+    queued = 0
+    with conn:
+        for (result_path,) in conn.execute("SELECT result_path FROM runs ORDER BY written_at").fetchall():
+            try:
+                with open(result_path, "r", encoding="utf-8") as f:
+                    row = result_row(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"[WARN] Skipping unreadable {result_path}: {e}")
+                continue
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO sheet_rows VALUES (?, ?, ?, ?, NULL)",
+                (row_key(row), result_path, json.dumps(row), time.time()),
+            )
+            queued += cur.rowcount
+    conn.close()
+    return queued
+
+
+def sync(service, sheet_id: str, chunk_size: int = CHUNK_SIZE, commit: bool = True,
+         path: str = run_manifest.MANIFEST_PATH) -> dict:
+    """Append all unsynced outbox rows, one values().append per chunk."""
+    queued = collect(path)
+    conn = connect(path)
+    pending = conn.execute(
+        "SELECT row_key, row_json FROM sheet_rows WHERE synced_at IS NULL ORDER BY queued_at"
+    ).fetchall()
+    seeded = sent = 0
+    try:
+        if pending and conn.execute("SELECT 1 FROM sheet_rows WHERE synced_at IS NOT NULL LIMIT 1").fetchone() is None:
+            # Nothing acknowledged on this clone yet: runs already in the sheet were sent elsewhere
+            present = sheet_keys(service, sheet_id)
+            acked = [r for r in pending if r["row_key"] in present]
+            pending = [r for r in pending if r["row_key"] not in present]
+            seeded = len(acked)
+            if commit and acked:
+                with conn:
+                    conn.executemany(
+                        "UPDATE sheet_rows SET synced_at = ? WHERE row_key = ?",
+                        [(time.time(), r["row_key"]) for r in acked],
+                    )
+        for i in range(0, len(pending), chunk_size):
+            chunk = pending[i:i + chunk_size]
+            service.spreadsheets().values().append(
+                spreadsheetId=sheet_id,
+                range=SHEET_RANGE,
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={"values": [json.loads(r["row_json"]) for r in chunk]},
+            ).execute()
+            if commit:
+                with conn:
+                    conn.executemany(
+                        "UPDATE sheet_rows SET synced_at = ? WHERE row_key = ?",
+                        [(time.time(), r["row_key"]) for r in chunk],
+                    )
+            sent += len(chunk)
+    finally:
+        conn.close()
+    return {"queued": queued, "seeded": seeded, "pending": len(pending), "sent": sent}
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Compiled skill matcher for ATS scoring.
+
+The skill list is compiled once into phrases of normalized tokens, so multi-word skills
+("power bi", "pivot tables") match. A JD is tokenized in one pass and only its distinct
+tokens are normalized, through a memoized variant table: British and American spellings,
+simple plurals, and hyphenated forms all match. SYNONYMS adds alternative phrasings for
+individual skills.
+"""
+
+import itertools
+import os
+
+import text_norm
+
+
+# British spelling -> the form skills are compiled in; suffix rules below cover the regular cases
+VARIANTS = {
+    "analyse": "analyze",
+    "analysed": "analyzed",
+    "analysing": "analyzing",
+    "behaviour": "behavior",
+    "catalogue": "catalog",
+    "centre": "center",
+    "colour": "color",
+    "defence": "defense",
+    "licence": "license",
+    "programme": "program",
+    "programmes": "program",
+}
+SUFFIXES = (("isation", "ization"), ("isations", "izations"), ("ising", "izing"), ("ised", "ized"),
+            ("ise", "ize"), ("elling", "eling"), ("elled", "eled"), ("ysing", "yzing"))
+SUFFIX_SAFE = frozenset({"enterprise", "exercise", "expertise", "premise", "promise", "raise", "revise",
+                         "supervise", "advertise", "compromise", "franchise", "merchandise", "otherwise", "rise",
+                         "wise", "noise", "precise", "concise", "surprise", "comprise", "devise", "excise"})
+
+# skill (as listed in skills.txt, lowercased) -> other phrasings that count as that skill
+SYNONYMS = {
+    "power bi": ["powerbi"],
+    "machine learning": ["ml"],
+    "etl": ["extract transform load"],
+    "vlookup": ["v lookup", "xlookup"],
+    "pivot tables": ["pivottables", "pivot table"],
+    "uipath rpa": ["uipath robotic process automation"],
+    "rpa": ["robotic process automation"],
+    "data visualization": ["dataviz"],
+    "stakeholder engagement": ["stakeholder management"],
+}
+
+_canon_cache = dict(VARIANTS)
+
+
+def canonical(token: str) -> str:
+    """Variant-normalized form of one lowercase token. Memoized, so repeat tokens are one dict lookup."""
+    out = _canon_cache.get(token)
+    if out is not None:
+        return out
+    out = token
+    if token not in SUFFIX_SAFE:
+        for uk, us in SUFFIXES:
+            if token.endswith(uk) and len(token) > len(uk) + 2:
+                out = token[: -len(uk)] + us
+                break
+    if len(out) > 3 and out.endswith("s") and not out.endswith(("ss", "us", "is")):
+        out = out[:-1]
+    _canon_cache[token] = out
+    return out
+
+
+def normalize(text: str) -> list:
+    """Canonical tokens of text; hyphenated words count as separate tokens."""
+    get = _canon_cache.get
+    return [get(t) or canonical(t) for t in text_norm.tokens(text.replace("-", " "))]
+
+
+class SkillMatcher:
+    """Skills compiled to canonical token phrases.
+
+    A JD is tokenized once. Only its distinct tokens are canonicalized; single-token skills
+    are then set lookups, and a multi-word skill is searched for in the token string only
+    when every one of its tokens occurs in the JD.
+    """
+
+    def __init__(self, skills: list, synonyms: dict = None):
+        self.skills = list(skills)
+        synonyms = SYNONYMS if synonyms is None else synonyms
+        single, multi = {}, {}
+        for i, skill in enumerate(self.skills):
+            for phrase in [skill] + synonyms.get(skill.lower(), []):
+                toks = tuple(normalize(phrase))
+                if len(toks) == 1:
+                    single.setdefault(toks[0], set()).add(i)
+                elif toks:
+                    multi.setdefault(toks, set()).add(i)
+        self._vocab = frozenset(single).union(*multi)
+        # every vocabulary token -> skills it is on its own, so lookups need no default
+        self._single = {t: frozenset(single.get(t, ())) for t in self._vocab}
+        # (tokens needed, " spaced phrase ", tokens, skill ids) per multi-word phrase
+        self._multi = [(frozenset(p), f" {' '.join(p)} ", p, frozenset(ids)) for p, ids in multi.items()]
+        self._known = {}      # raw token -> canonical token if any skill uses it, else ""
+        self._respelled = {}  # the subset of _known whose raw token differs from its canonical one
+
+    def match_ids(self, text: str) -> set:
+        flat = f" {text.replace('-', ' ').translate(text_norm.TOKEN_TABLE)} "  # tokens between spaces
+        toks = flat.split()
+        distinct = set(toks)
+        known, vocab = self._known, self._vocab
+        for t in distinct.difference(known):
+            c = canonical(t)
+            known[t] = c if c in vocab else ""
+            if known[t] and c != t:
+                self._respelled[t] = c
+        present = set(map(known.__getitem__, distinct))
+        present.discard("")
+        found = set().union(*map(self._single.__getitem__, present))
+        forms = joined = None
+        for needed, spaced, phrase, ids in self._multi:
+            if not needed <= present or ids <= found:
+                continue
+            if forms is None:
+                forms = {}  # canonical token -> its spellings in text, for tokens spelled differently
+                for t in distinct.intersection(self._respelled):
+                    forms.setdefault(known[t], set()).add(t)
+                for c, spelled in forms.items():
+                    if known.get(c) == c:
+                        spelled.add(c)
+            if needed.isdisjoint(forms):
+                spellings = (spaced,)
+            else:
+                spellings = [f" {' '.join(p)} " for p in itertools.product(*[forms.get(c, (c,)) for c in phrase])]
+            for sp in spellings:
+                if sp in flat:
+                    break
+            else:
+                # punctuation leaves runs of spaces in flat; retry on the single-spaced tokens
+                if joined is None:
+                    joined = f" {' '.join(toks)} "
+                for sp in spellings:
+                    if sp in joined:
+                        break
+                else:
+                    continue
+            found |= ids
+        return found
+
+    def matched(self, text: str) -> list:
+        """Skills present in text, in skills-file order."""
+        return [self.skills[i] for i in sorted(self.match_ids(text))]
+
+    def score(self, text: str) -> float:
+        """Percent of skills present in text."""
+        if not self.skills:
+            return 0.0
+        return round(len(self.match_ids(text)) / len(self.skills) * 100, 2)
+
+    def score_many(self, texts) -> list:
+        return [self.score(t) for t in texts]
+
+    def matched_many(self, texts) -> list:
+        return [self.matched(t) for t in texts]
+
+
+_compiled = {}
+
+
+def load_skills(skills_file: str) -> list:
+    with open(skills_file, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def load_matcher(skills_file: str) -> SkillMatcher:
+    """Compiled matcher for skills_file, recompiled only when the file changes."""
+    st = os.stat(skills_file)
+    key = os.path.abspath(skills_file)
+    cached = _compiled.get(key)
+    if cached and cached[0] == (st.st_mtime_ns, st.st_size):
+        return cached[1]
+    matcher = SkillMatcher(load_skills(skills_file))
+    _compiled[key] = ((st.st_mtime_ns, st.st_size), matcher)
+    return matcher
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    skills_path = "data/skills.txt"
+    args = sys.argv[1:]
+    if len(args) >= 2 and args[0] == "--skills":
+        skills_path, args = args[1], args[2:]
+    m = load_matcher(skills_path)
+    report = []
+    for p in args:
+        with open(p, "r", encoding="utf-8") as f:
+            text = f.read()
+        report.append({"jd": p, "score": m.score(text), "matched": m.matched(text)})
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Shared text normalization and tokenization for the resume and ATS scripts.
+Translate tables and patterns are built once at import, so sanitizing is one str.translate
+plus one whitespace pass and tokenizing is one str.translate plus split().
+"""
+
+import re
+
+
+# Typographic punctuation folded to ASCII before anything else non-ASCII is dropped
+ASCII_FOLD = {
+    0x2014: "-",  # em dash
+    0x2013: "-",  # en dash
+    0x201C: '"',
+    0x201D: '"',
+    0x2019: "'",
+    0x2018: "'",
+    0x2022: "*",  # bullet
+}
+
+TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+
+_SPACES = re.compile(r"[ \t]+")
+
+
+class _SanitizeTable(dict):
+    """str.translate table: keeps ASCII, folds ASCII_FOLD, deletes other code points."""
+
+    def __missing__(self, code):
+        value = code if code < 128 else None
+        self[code] = value
+        return value
+
+
+class _TokenTable(dict):
+    """str.translate table: lowercases ASCII letters, keeps [a-z0-9-], blanks everything else."""
+
+    def __missing__(self, code):
+        ch = chr(code).lower() if code < 128 else ""
+        value = ch if ch in TOKEN_CHARS and ch else " "
+        self[code] = value
+        return value
+
+
+SANITIZE_TABLE = _SanitizeTable(ASCII_FOLD)
+TOKEN_TABLE = _TokenTable()
+
+
+def sanitize(text: str) -> str:
+    """Plain ASCII text with runs of spaces and tabs collapsed, ends trimmed."""
+    return _SPACES.sub(" ", text.translate(SANITIZE_TABLE)).strip()
+
+
+def tokens(text: str, stop=frozenset()) -> list:
+    """Lowercase [a-z0-9-] tokens, minus any in stop."""
+    toks = text.translate(TOKEN_TABLE).split()
+    return [t for t in toks if t not in stop] if stop else toks
+
+
+def iter_tokens(chunks, stop=frozenset()):
+    """Streaming tokens() over an iterable of text chunks; tokens may span chunk boundaries."""
+    carry = ""
+    for chunk in chunks:
+        buf = carry + chunk.translate(TOKEN_TABLE)
+        parts = buf.split()
+        carry = parts.pop() if parts and not buf[-1].isspace() else ""
+        for t in parts:
+            if t not in stop:
+                yield t
+    if carry and carry not in stop:
+        yield carry
+
+
+def read_chunks(path, size: int = 1 << 16):
+    """Yield a UTF-8 text file in chunks for iter_tokens()."""
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                return
+            yield chunk
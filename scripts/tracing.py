@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Lightweight tracing spans for the resume generator.
+Spans are buffered in memory and written as JSONL next to a run's outputs, ending with a
+per stage summary record. Timings stay out of result.json so it is deterministic.
+profiled() wraps a block in cProfile or tracemalloc for CI.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class Tracer:
+    def __init__(self):
+        self.spans = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """Time a block. Yields the span dict so callers can attach attributes such as status or tokens."""
+        rec = {"name": name, "start": time.time(), **attrs}
+        t0 = time.perf_counter()
+        try:
+            yield rec
+        except Exception as e:
+            rec["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            rec["duration_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+            with self._lock:
+                self.spans.append(rec)
+
+    def write_jsonl(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            for rec in sorted(self.spans, key=lambda r: r["start"]):
+                f.write(json.dumps(rec, ensure_ascii=True) + "\n")
+            f.write(json.dumps({"name": "summary", **self.summary()}, ensure_ascii=True) + "\n")
+
+    def summary(self) -> dict:
+        """Per stage count, total and max latency, plus token and retry totals."""
+        stages = {}
+        totals = {"prompt_tokens": 0, "completion_tokens": 0, "retries": 0, "cache_hits": 0}
+        for rec in self.spans:
+            s = stages.setdefault(rec["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            s["count"] += 1
+            s["total_ms"] = round(s["total_ms"] + rec["duration_ms"], 2)
+            s["max_ms"] = max(s["max_ms"], rec["duration_ms"])
+            for key in ("prompt_tokens", "completion_tokens", "retries"):
+                totals[key] += rec.get(key) or 0
+            totals["cache_hits"] += 1 if rec.get("cache_hit") else 0
+        ttfb = [rec["ttfb_ms"] for rec in self.spans if rec.get("ttfb_ms") is not None]
+        if ttfb:
+            totals["first_bullet_ms"] = min(ttfb)
+        return {"stages": stages, **totals}
+
+
+@contextmanager
+def profiled(mode: str = None, out_dir: str = ".cache/profile"):
+    """Optional profiling around a block: mode is None, "cprofile" or "tracemalloc".
+
+    cProfile only sees the calling thread, so bullet requests running in worker threads
+    show up as time waiting on their futures; use the trace.jsonl spans for those.
+    tracemalloc covers every thread.
+    """
+    if not mode:
+        yield
+        return
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    if mode == "cprofile":
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            yield
+        finally:
+            prof.disable()
+            out = Path(out_dir) / f"{stamp}.pstats"
+            prof.dump_stats(str(out))
+            buf = io.StringIO()
+            pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(15)
+            print(buf.getvalue())
+            print(f"[DEBUG] Wrote profile: {out}")
+    elif mode == "tracemalloc":
+        tracemalloc.start()
+        try:
+            yield
+        finally:
+            snap = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"[DEBUG] Peak traced memory: {peak / 1024:.1f} KB")
+            for stat in snap.statistics("lineno")[:10]:
+                print(f"  {stat}")
+    else:
+        raise ValueError(f"Unknown profile mode: {mode}")
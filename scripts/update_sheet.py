@@ -2,34 +2,49 @@ import os
 import json
 from pathlib import Path
 from datetime import datetime
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+
+import run_manifest
+import sheet_outbox
+from fake_sheets import FakeSheetsService
 
 def find_latest_result_json():
-    """Find the most recently modified result.json file by actual file time."""
-    runs_dir = Path("runs")
-    if not runs_dir.exists():
-        print("[ERROR] No runs directory found")
-        return None
-    
-    # Find all result.json files
-    result_files = list(runs_dir.glob("*/outputs/result.json"))
-    if not result_files:
+    """Most recently written result.json, looked up in the run manifest.
+
+    latest() skips and prunes rows whose file is gone; if none is left the runs folder is
+    scanned again.
+    """
+    entry = run_manifest.latest()
+    if entry is None:
+        # Empty or stale manifest (fresh clone, CI checkout, deleted runs): index existing runs.
+        if not Path("runs").exists():
+            print("[ERROR] No runs directory found")
+            return None
+        print(f"[DEBUG] No live run in manifest, indexed {run_manifest.rebuild()} result.json files")
+        entry = run_manifest.latest()
+    if entry is None:
         print("[ERROR] No result.json files found")
         return None
-    
-    print(f"[DEBUG] Found {len(result_files)} result.json files:")
-    for f in result_files:
-        folder_name = f.parent.parent.name
-        mtime = datetime.fromtimestamp(f.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-        print(f"  - {folder_name} (modified: {mtime})")
-    
-    # Sort by file modification time only - most recent first
-    latest_file = max(result_files, key=lambda f: f.stat().st_mtime)
-    latest_mtime = datetime.fromtimestamp(latest_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-    print(f"[DEBUG] Latest by modification time: {latest_file.parent.parent.name} ({latest_mtime})")
+
+    latest_file = Path(entry["result_path"])
+    latest_mtime = datetime.fromtimestamp(entry["written_at"]).strftime('%Y-%m-%d %H:%M:%S')
+    print(f"[DEBUG] Latest by run manifest: {entry['run_folder']} ({latest_mtime})")
     return latest_file
 
+def build_sheets_service(creds_json: str):
+    """Sheets v4 client built from the discovery document bundled with google-api-python-client.
+
+    Google libraries are imported here rather than at module load so commands that never
+    reach the API stay fast to start.
+    """
+    from google.oauth2.service_account import Credentials
+    from googleapiclient.discovery import build
+
+    creds = Credentials.from_service_account_info(
+        json.loads(creds_json),
+        scopes=["https://www.googleapis.com/auth/spreadsheets"]
+    )
+    return build("sheets", "v4", credentials=creds, static_discovery=True, cache_discovery=False)
+
 def update_sheet(result_json_path: str = None):
     """Append exactly 1 row into the Google Sheet, matching header order."""
     creds_json = os.environ.get("GOOGLE_SHEETS_CREDENTIALS")
@@ -54,12 +69,7 @@ def update_sheet(result_json_path: str = None):
         print(f"[DEBUG] Using latest file instead: {result_json_path}")
 
     try:
-        creds_dict = json.loads(creds_json)
-        creds = Credentials.from_service_account_info(
-            creds_dict,
-            scopes=["https://www.googleapis.com/auth/spreadsheets"]
-        )
-        service = build("sheets", "v4", credentials=creds)
+        service = build_sheets_service(creds_json)
 
         with open(result_json_path, "r", encoding="utf-8") as f:
             result = json.load(f)
@@ -67,15 +77,7 @@ def update_sheet(result_json_path: str = None):
         print(f"[DEBUG] Loaded result data: {result}")
 
         # Strict 7-column row, always in the right order
-        row = [
-            result.get("date", ""),          # Date
-            result.get("company", ""),       # Company
-            result.get("job_title", ""),     # Job Title
-            result.get("jd_path", ""),       # JD Path
-            result.get("closing_date", ""),  # Closing Date
-            result.get("jd_url", ""),        # JD URL
-            result.get("ats_score", ""),     # ATS Score
-        ]
+        row = sheet_outbox.result_row(result)
 
         print(f"[DEBUG] Prepared row (length={len(row)}): {row}")
 
@@ -87,11 +89,12 @@ def update_sheet(result_json_path: str = None):
         body = {"values": [row]}
         service.spreadsheets().values().append(
             spreadsheetId=sheet_id,
-            range="Sheet1!A:G",  # 7 fixed columns
+            range=sheet_outbox.SHEET_RANGE,
             valueInputOption="RAW",
             insertDataOption="INSERT_ROWS",
             body=body
         ).execute()
+        sheet_outbox.mark_synced(result_json_path, row)
 
         print(f"[SUCCESS] Updated Google Sheet with row: {row}")
 
@@ -100,9 +103,32 @@ def update_sheet(result_json_path: str = None):
         import traceback
         traceback.print_exc()
 
+def sync_sheet(dry_run: bool = False, chunk_size: int = sheet_outbox.CHUNK_SIZE):
+    """Send every unsynced result.json row in batched appends, skipping rows already acknowledged."""
+    if dry_run:
+        service = FakeSheetsService()
+        stats = sheet_outbox.sync(service, "dry-run", chunk_size=chunk_size, commit=False)
+        for row in service.rows:
+            print(f"[DRY RUN] {row}")
+        print(f"[DEBUG] Outbox: {stats}")
+        return stats
+
+    creds_json = os.environ.get("GOOGLE_SHEETS_CREDENTIALS")
+    sheet_id = os.environ.get("SHEET_ID")
+    if not creds_json or not sheet_id:
+        print("[WARN] Missing Google Sheets credentials or SHEET_ID. Skipping sheet sync.")
+        return None
+
+    service = build_sheets_service(creds_json)
+    stats = sheet_outbox.sync(service, sheet_id, chunk_size=chunk_size)
+    print(f"[SUCCESS] Synced Google Sheet: {stats}")
+    return stats
+
 if __name__ == "__main__":
     import sys
-    if len(sys.argv) < 2:
+    if "--sync" in sys.argv or "--dry-run" in sys.argv:
+        sync_sheet(dry_run="--dry-run" in sys.argv)
+    elif len(sys.argv) < 2:
         print("Using latest result.json file...")
         update_sheet()
     else:
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Watch runs/*/inputs/ and regenerate a run as soon as its JD is saved.
+
+One long-running process keeps baselines, the JD document-frequency index, the bullet
+candidates and the pooled HTTP client in memory, so a saved JD only pays for its own
+stages. Edits are debounced: a JD is processed once its mtime and size have held still for
+--debounce seconds. Each regeneration writes the resume, result.json and
+outputs/ats_report.md. Editing baselines.json or any offline bullet source reloads the warm
+state and rechecks every run.
+
+    python3 scripts/watch.py --bullets offline
+    python3 scripts/watch.py --once        # catch up on changed runs and exit
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import generate_resume_from_jd as gen
+from jd_corpus import INDEX_PATH, DocFreqIndex
+from output_store import write_if_changed
+from pipeline import ats_report_md, read_settings
+from tracing import Tracer
+
+
+POLL_INTERVAL = 0.1
+DEBOUNCE = 0.3
+
+
+def _stat(path: Path):
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def sources_stat() -> tuple:
+    """(path, mtime, size) of baselines.json and every offline bullet source, to notice edits."""
+    paths = [Path(gen.BASELINES_PATH)]
+    for pattern in gen.OFFLINE_SOURCES:
+        paths.extend(sorted(Path().glob(pattern)))
+    return tuple((p.as_posix(), _stat(p)) for p in paths)
+
+
+class WarmState:
+    """Everything a regeneration needs that does not depend on the JD being processed."""
+
+    def __init__(self, runs_dir: str = "runs", bullets: str = gen.BULLETS, max_workers: int = gen.MAX_WORKERS):
+        self.runs_dir = runs_dir
+        self.bullets = bullets
+        self.max_workers = max_workers
+        self.df_index = DocFreqIndex.load(INDEX_PATH)
+        self.session = None
+        self.client = None
+        self.baselines = None
+        self.sources_stat = None
+        self.settings = {}
+        self.candidates = None
+        self.budget = None
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """Reload baselines, settings and bullet candidates if any of their sources changed. Returns True if so."""
+        stat = sources_stat()
+        if self.baselines is not None and stat == self.sources_stat:
+            return False
+        self.baselines = gen.load_baselines()
+        self.settings = read_settings()
+        self.sources_stat = stat
+        if self.bullets == "offline":
+            from bullet_optimizer import load_candidates, word_budget
+
+            self.candidates = load_candidates(self.baselines)
+            self.budget = word_budget()
+        return True
+
+    def sync_corpus(self, jds: list):
+        if self.df_index.update(jds):
+            self.df_index.save(INDEX_PATH)
+
+    def select_bullets(self, jd_path, baselines, fixed_words=0):
+        from bullet_optimizer import offline_bullets
+
+        return offline_bullets(jd_path, baselines, fixed_words, candidates=self.candidates,
+                               df_index=self.df_index, budget=self.budget)
+
+    def llm_client(self):
+        if self.client is None:
+            self.session = gen.make_session(self.max_workers)
+            self.client = gen.make_client(self.session, self.max_workers)
+        return self.client
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+
+    def regenerate(self, jd_path: Path, digest: str) -> float:
+        """Rebuild a run and its ats_report.md. Returns the coverage percent."""
+        tracer = Tracer()
+        client = None if self.bullets == "offline" else self.llm_client()
+        md_file, result = gen.build_resume(jd_path, self.baselines, self.max_workers, client=client, digest=digest,
+                                           tracer=tracer, bullets=self.bullets, select_bullets=self.select_bullets)
+        with tracer.span("ats_report"):
+            goal = self.settings.get("ats", {}).get("coverage_target_percent")
+            report, pct = ats_report_md(jd_path.read_text(encoding="utf-8"), md_file.read_text(encoding="utf-8"),
+                                        self.df_index, goal)
+            write_if_changed(md_file.parent / "ats_report.md", report)
+        return pct
+
+
+class Watcher:
+    def __init__(self, state: WarmState, debounce: float = DEBOUNCE):
+        self.state = state
+        self.debounce = debounce
+        self.seen = {}     # jd path -> (mtime_ns, size) last processed
+        self.pending = {}  # jd path -> ((mtime_ns, size), first seen at)
+
+    def scan(self, now: float) -> list:
+        """JDs whose content changed and has been stable for the debounce window."""
+        baselines_changed = self.state.refresh()
+        if baselines_changed:
+            self.seen.clear()
+        jds = gen.discover_jds(self.state.runs_dir)
+        ready = []
+        for jd in jds:
+            stat = _stat(jd)
+            if stat is None or self.seen.get(jd) == stat:
+                self.pending.pop(jd, None)
+                continue
+            prev = self.pending.get(jd)
+            if prev is None or prev[0] != stat:
+                self.pending[jd] = (stat, now)
+            elif now - prev[1] >= self.debounce:
+                ready.append(jd)
+        if ready:
+            self.state.sync_corpus(jds)
+        return ready
+
+    def process(self, jd_path: Path):
+        stat = _stat(jd_path)
+        self.pending.pop(jd_path, None)
+        self.seen[jd_path] = stat
+        digest = gen.input_hash(jd_path, self.state.baselines, self.state.bullets)
+        if gen.recorded_hash(jd_path) == digest:
+            return
+        t0 = time.perf_counter()
+        try:
+            pct = self.state.regenerate(jd_path, digest)
+        except Exception as e:
+            print(f"[WARN] Run failed for {jd_path}: {e}")
+            return
+        ms = (time.perf_counter() - t0) * 1000
+        print(f"[watch] {jd_path.parent.parent.name}: coverage {pct} percent in {ms:.0f} ms")
+
+    def run(self, once: bool = False, interval: float = POLL_INTERVAL):
+        if once:
+            self.debounce = 0.0
+            self.scan(time.monotonic())
+        while True:
+            for jd in self.scan(time.monotonic()):
+                self.process(jd)
+            if once:
+                return
+            time.sleep(interval)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Regenerate runs as their JDs change")
+    ap.add_argument("--runs", default="runs", help="Runs directory to watch")
+    ap.add_argument("--bullets", choices=["llm", "offline"], default=gen.BULLETS,
+                    help="Bullet source for regenerated resumes (also CASSANDRA_BULLETS)")
+    ap.add_argument("--workers", type=int, default=gen.MAX_WORKERS, help="Concurrent bullet requests")
+    ap.add_argument("--debounce", type=float, default=DEBOUNCE, help="Seconds a JD must stay unchanged")
+    ap.add_argument("--interval", type=float, default=POLL_INTERVAL, help="Polling interval in seconds")
+    ap.add_argument("--once", action="store_true", help="Process runs with changed inputs once and exit")
+    args = ap.parse_args()
+    state = WarmState(args.runs, args.bullets, args.workers)
+    print(f"[watch] Watching {args.runs}/*/inputs/ ({args.bullets} bullets)")
+    try:
+        Watcher(state, args.debounce).run(args.once, args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        state.close()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# scripts/ modules import each other as siblings, the way they run from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
@@ -0,0 +1,66 @@
+import os
+
+import llm_cache
+from llm_cache import LLMCache
+
+URL = "https://api.openai.com/v1/chat/completions"
+
+
+def test_key_covers_payload_and_endpoint():
+    payload = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.4}
+    reordered = {"temperature": 0.4, "messages": payload["messages"], "model": "m"}
+
+    assert LLMCache.key(payload, URL) == LLMCache.key(reordered, URL)
+    assert LLMCache.key(payload, URL) != LLMCache.key({**payload, "temperature": 0.5}, URL)
+    assert LLMCache.key(payload, URL) != LLMCache.key(payload, "http://127.0.0.1:8765/v1/chat/completions")
+
+
+def test_entries_expire_after_ttl(tmp_path, monkeypatch):
+    cache = LLMCache(tmp_path, ttl=60)
+    now = 1_000_000.0
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now)
+    cache.put("ab12", "bullets")
+
+    now += 59
+    assert cache.get("ab12") == "bullets"
+    now += 2
+    assert cache.get("ab12") is None
+    assert not (tmp_path / "ab" / "ab12.json").exists()
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_disabled_cache_neither_reads_nor_writes(tmp_path):
+    LLMCache(tmp_path).put("ab12", "bullets")
+    cache = LLMCache(tmp_path, enabled=False)
+    cache.put("cd34", "other")
+
+    assert cache.get("ab12") is None
+    assert not (tmp_path / "cd").exists()
+
+
+def test_eviction_drops_least_recently_used_below_the_limit(tmp_path):
+    cache = LLMCache(tmp_path, max_entries=10)
+    keys = [f"{i:02d}{'0' * 62}" for i in range(10)]
+    for i, key in enumerate(keys):
+        cache.put(key, str(i))
+        os.utime(cache._path(key), (i, i))
+    cache.get(keys[0])  # touched, so now the most recently used
+
+    cache.put("ff" + "0" * 62, "new")
+
+    left = {p.stem for p in tmp_path.glob("*/*.json")}
+    assert len(left) == 9  # 10% headroom so the next put does not rescan
+    assert keys[0] in left and "ff" + "0" * 62 in left
+    assert keys[1] not in left and keys[2] not in left
+
+
+def test_puts_below_the_limit_do_not_rescan(tmp_path, monkeypatch):
+    cache = LLMCache(tmp_path, max_entries=1000)
+    scans = []
+    evict = cache._evict
+    monkeypatch.setattr(cache, "_evict", lambda: (scans.append(1), evict()))
+
+    for i in range(llm_cache.EVICT_EVERY + 1):
+        cache.put(f"{i:064x}", "x")
+
+    assert len(scans) == 2  # first put, then every EVICT_EVERY puts
@@ -0,0 +1,175 @@
+import io
+import json
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+import llm_client
+from llm_client import AdaptiveLimiter, ChatClient, iter_sse, retry_after_seconds
+from mock_llm_server import MockConfig, running
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+
+
+class FakeSession:
+    """Answers posts from a script of responses or exceptions."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        item = self.script.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry sleeps instead of waiting them out."""
+    recorded = []
+    monkeypatch.setattr(llm_client.time, "sleep", recorded.append)
+    return recorded
+
+
+def make_client(session, **kwargs):
+    return ChatClient("http://llm.test/v1/chat/completions", "key", session=session, rate=1000, **kwargs)
+
+
+def test_429_with_retry_after_then_200_against_mock_server():
+    config = MockConfig(latency=0.0, rate_limit=1)
+    with running(config) as url:
+        client = ChatClient(url, "mock", session=requests.Session(), rate=1000, max_concurrency=4)
+        first, _ = client.post({"messages": []}, timeout=10)
+        t0 = time.monotonic()
+        resp, retries = client.post({"messages": []}, timeout=10)
+        waited = time.monotonic() - t0
+
+    assert first.status_code == 200 and resp.status_code == 200
+    assert retries == 1 and config.throttled == 1
+    assert waited >= 0.5  # slept for the server's Retry-After, not a short jittered backoff
+    assert client.limiter.limit == 2
+
+
+def test_retry_after_accepts_seconds_and_http_dates():
+    assert retry_after_seconds("2.5") == 2.5
+    assert retry_after_seconds("-1") == 0.0
+    assert 8 < retry_after_seconds(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert retry_after_seconds("soon") is None
+    assert retry_after_seconds(None) is None
+
+
+def test_retry_after_is_preferred_over_backoff(sleeps):
+    session = FakeSession(FakeResponse(429, {"Retry-After": "3"}), FakeResponse(503), FakeResponse(200))
+    resp, retries = make_client(session, base_delay=0.5, max_delay=30).post({})
+
+    assert resp.status_code == 200 and retries == 2
+    assert sleeps[0] == 3.0
+    assert 0 <= sleeps[1] <= 1.0  # full jitter over base_delay * 2
+
+
+def test_retry_after_is_capped_at_max_delay(sleeps):
+    session = FakeSession(FakeResponse(429, {"Retry-After": "600"}), FakeResponse(200))
+    make_client(session, max_delay=5).post({})
+
+    assert sleeps == [5]
+
+
+def test_gives_up_after_max_retries(sleeps):
+    session = FakeSession(*[FakeResponse(500) for _ in range(3)])
+    resp, retries = make_client(session, max_retries=2).post({})
+    assert resp.status_code == 500 and retries == 2 and session.calls == 3
+
+    error = requests.ConnectionError("refused")
+    with pytest.raises(requests.ConnectionError):
+        make_client(FakeSession(error, error), max_retries=1).post({})
+
+
+def test_other_4xx_is_returned_without_retry_or_limit_change(sleeps):
+    client = make_client(FakeSession(FakeResponse(400)), max_concurrency=2)
+    resp, retries = client.post({})
+
+    assert resp.status_code == 400 and retries == 0 and sleeps == []
+    assert client.limiter.limit == 2 and client.limiter._successes == 0
+
+
+def test_limiter_halves_on_throttle_and_grows_back_one_per_window():
+    limiter = AdaptiveLimiter(initial=8, maximum=8)
+    limiter.on_throttle()
+    assert limiter.limit == 4
+    for _ in range(3):
+        limiter.on_throttle()
+    assert limiter.limit == 1  # never below minimum
+
+    limiter.on_success()
+    assert limiter.limit == 2
+    limiter.on_success()
+    assert limiter.limit == 2
+    limiter.on_success()
+    assert limiter.limit == 3
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.limit == 8  # capped at maximum
+
+
+def test_iter_sse_skips_comments_and_blank_lines_and_stops_at_done():
+    lines = [b": keep-alive", b"", b"event: message", b'data: {"n": 1}', "data:{\"n\": 2}", b"data: ",
+             b"data: [DONE]", b'data: {"n": 3}']
+    assert [e["n"] for e in iter_sse(lines)] == [1, 2]
+
+
+def test_iter_sse_raises_on_malformed_event():
+    events = iter_sse([b'data: {"n": 1}', b'data: {"n": '])
+    assert next(events) == {"n": 1}
+    with pytest.raises(ValueError):
+        next(events)
+
+
+class ChunkedRaw(io.BytesIO):
+    """Body that hands out at most `size` bytes per read, like a slow socket."""
+
+    def __init__(self, data, size):
+        super().__init__(data)
+        self.size = size
+
+    def read(self, n=-1, **kwargs):
+        return super().read(self.size)
+
+
+def sse_response(events, size):
+    body = "".join(f"data: {json.dumps(e)}\r\n\r\n" for e in events) + "data: [DONE]\r\n\r\n"
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = ChunkedRaw(body.encode("utf-8"), size)
+    return resp
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64])
+def test_stream_reassembles_events_split_across_reads(size):
+    words = ["Café ", "latency ", "dashboards"]
+    events = [{"choices": [{"delta": {"content": w}}]} for w in words]
+    events.append({"choices": [], "usage": {"prompt_tokens": 5, "completion_tokens": 3}})
+    client = make_client(FakeSession(sse_response(events, size)))
+    meta = {}
+
+    assert "".join(client.stream({}, meta=meta)) == "".join(words)
+    assert meta == {"status": 200, "retries": 0, "prompt_tokens": 5, "completion_tokens": 3}
+
+
+def test_stream_against_mock_server_reports_usage():
+    with running(MockConfig(latency=0.0, content="one two three")) as url:
+        client = ChatClient(url, "mock", session=requests.Session(), rate=1000)
+        meta = {}
+        text = "".join(client.stream({"messages": [{"role": "user", "content": "a b"}]}, timeout=10, meta=meta))
+
+    assert text == "one two three"
+    assert meta["completion_tokens"] == 3 and meta["prompt_tokens"] == 2
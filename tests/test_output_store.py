@@ -0,0 +1,97 @@
+import json
+import os
+
+import output_store
+from output_store import compact, history, json_same_except, restore, write_if_changed
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    store = tmp_path / "store"
+    path = tmp_path / "outputs" / "resume.md"
+
+    assert write_if_changed(path, "one", store=store)
+    os.utime(path, ns=(1, 1))
+    assert not write_if_changed(path, "one", store=store)
+    assert path.stat().st_mtime_ns == 1
+    assert write_if_changed(path, "two", store=store)
+
+    versions = history(path.parent, "resume.md")
+    assert [v["sha256"] for v in versions] == [output_store.digest(b"one"), output_store.digest(b"two")]
+    assert output_store.object_path(versions[0]["sha256"], store).read_bytes() == b"one"
+
+
+def test_json_same_except_ignores_only_the_given_keys():
+    same = json_same_except("date")
+    a = json.dumps({"date": "2025-09-17", "company": "Acme"}).encode()
+    assert same(a, json.dumps({"company": "Acme", "date": "2025-09-18"}).encode())
+    assert not same(a, json.dumps({"date": "2025-09-17", "company": "Other"}).encode())
+    assert not same(b"not json", a)
+
+
+def test_json_same_except_keeps_file_untouched(tmp_path):
+    path = tmp_path / "result.json"
+    store = tmp_path / "store"
+    write_if_changed(path, json.dumps({"date": "2025-09-17", "company": "Acme"}), store=store)
+    written = write_if_changed(path, json.dumps({"date": "2025-09-18", "company": "Acme"}),
+                               same=json_same_except("date"), store=store)
+    assert not written
+    assert json.loads(path.read_text())["date"] == "2025-09-17"
+
+
+def make_outputs(tmp_path, files: dict, company: str = "Acme Two"):
+    out = tmp_path / "runs" / "2025-09-17_Acme_Analyst" / "outputs"
+    out.mkdir(parents=True)
+    (out / "result.json").write_text(json.dumps({"company": company}), encoding="utf-8")
+    for name, text in files.items():
+        (out / name).write_text(text, encoding="utf-8")
+    return out
+
+
+def test_compact_keeps_the_resume_result_json_names(tmp_path):
+    out = make_outputs(tmp_path, {"Gamal_Mensah_Resume_Acme_Two.md": "same", "Gamal_Mensah_Resume_Acme_63.md": "same",
+                                  "Gamal_Mensah_Resume_zzz.md": "same", "Gamal_Mensah_Resume_Old.md": "older"})
+    store = tmp_path / "store"
+
+    plan = compact(tmp_path / "runs", store=store)
+    assert {r["kept"] for r in plan["removed"]} == {"Gamal_Mensah_Resume_Acme_Two.md"}
+    assert (out / "Gamal_Mensah_Resume_zzz.md").exists()  # only a plan without apply
+
+    compact(tmp_path / "runs", apply=True, store=store)
+    assert sorted(p.name for p in out.glob("*.md")) == ["Gamal_Mensah_Resume_Acme_Two.md", "Gamal_Mensah_Resume_Old.md"]
+    assert compact(tmp_path / "runs", store=store)["removed"] == []
+
+
+def test_compact_prefers_resume_file_recorded_in_result_json(tmp_path):
+    out = make_outputs(tmp_path, {"Gamal_Mensah_Resume_A.md": "same", "Gamal_Mensah_Resume_B.md": "same"})
+    (out / "result.json").write_text(json.dumps({"company": "A", "resume_file": "Gamal_Mensah_Resume_B.md"}))
+    compact(tmp_path / "runs", apply=True, store=tmp_path / "store")
+    assert [p.name for p in out.glob("*.md")] == ["Gamal_Mensah_Resume_B.md"]
+
+
+def test_compact_never_folds_other_artifacts(tmp_path):
+    out = make_outputs(tmp_path, {"cover_letter.md": "same", "follow_up_note.md": "same",
+                                  "Gamal_Mensah_Resume_Acme_Two.md": "same"})
+    plan = compact(tmp_path / "runs", apply=True, store=tmp_path / "store")
+    assert plan["removed"] == []
+    assert (out / "cover_letter.md").exists() and (out / "follow_up_note.md").exists()
+
+
+def test_compact_removed_files_are_restorable(tmp_path):
+    out = make_outputs(tmp_path, {"Gamal_Mensah_Resume_Acme_Two.md": "same", "Gamal_Mensah_Resume_a_1.md": "same"})
+    store = tmp_path / "store"
+    compact(tmp_path / "runs", apply=True, store=store)
+
+    removed = [v for v in history(out) if v["event"] == "removed"]
+    assert [v["file"] for v in removed] == ["Gamal_Mensah_Resume_a_1.md"]
+    restore(out, removed[0]["sha256"][:8], "Gamal_Mensah_Resume_a_1.md", store=store)
+    assert (out / "Gamal_Mensah_Resume_a_1.md").read_text(encoding="utf-8") == "same"
+
+
+def test_compact_drops_unreferenced_objects(tmp_path):
+    make_outputs(tmp_path, {"a.md": "kept"})
+    store = tmp_path / "store"
+    orphan = output_store.put_object(b"orphan", store)
+
+    plan = compact(tmp_path / "runs", apply=True, store=store)
+    assert plan["objects_dropped"] == 1
+    assert not output_store.object_path(orphan, store).exists()
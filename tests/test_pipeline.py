@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+
+from pipeline import Node, run_dag
+
+
+def test_nodes_receive_their_dependencies_results():
+    nodes = [
+        Node("resume", lambda deps: "resume"),
+        Node("letter", lambda deps: deps["resume"] + "+letter", ("resume",)),
+        Node("report", lambda deps: sorted(deps), ("resume", "letter")),
+    ]
+    assert run_dag(nodes) == {"resume": "resume", "letter": "resume+letter", "report": ["letter", "resume"]}
+
+
+def test_independent_nodes_run_concurrently():
+    both = threading.Barrier(2, timeout=5)  # breaks, and fails the nodes, unless both are in flight
+    nodes = [Node(name, lambda deps: both.wait() is not None) for name in ("a", "b")]
+
+    assert run_dag(nodes, workers=2) == {"a": True, "b": True}
+
+
+def test_failure_reaches_dependents_but_not_other_branches():
+    error = RuntimeError("no key")
+    ran = []
+
+    def fail(deps):
+        raise error
+
+    nodes = [
+        Node("resume", fail),
+        Node("report", lambda deps: ran.append("report"), ("resume",)),
+        Node("note", lambda deps: ran.append("note") or "note", ("report",)),
+        Node("letter", lambda deps: "letter"),
+    ]
+    results = run_dag(nodes)
+
+    assert results["resume"] is error and results["report"] is error and results["note"] is error
+    assert results["letter"] == "letter" and ran == []
+
+
+def test_unresolvable_dependencies_raise():
+    nodes = [Node("a", lambda deps: 1), Node("b", lambda deps: 2, ("missing",))]
+    with pytest.raises(ValueError, match="b"):
+        run_dag(nodes)
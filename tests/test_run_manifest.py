@@ -0,0 +1,82 @@
+import json
+
+import run_manifest
+
+
+def make_result(root, name, date="2025-09-17"):
+    path = root / "runs" / name / "outputs" / "result.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"date": date, "company": name, "ats_score": 80}), encoding="utf-8")
+    return path
+
+
+def test_latest_skips_and_prunes_rows_for_deleted_runs(tmp_path):
+    db = str(tmp_path / "manifest.sqlite")
+    for i, name in enumerate(["a", "b", "c"]):
+        path = make_result(tmp_path, name)
+        run_manifest.record_result(path, {"company": name}, written_at=i, path=db)
+    (tmp_path / "runs" / "c" / "outputs" / "result.json").unlink()
+    (tmp_path / "runs" / "a" / "outputs" / "result.json").unlink()
+
+    assert run_manifest.latest(path=db)["company"] == "b"
+    rows = run_manifest._query("SELECT company FROM runs ORDER BY written_at", path=db)
+    assert [r["company"] for r in rows] == ["a", "b"]  # only rows passed on the way are pruned
+
+
+def test_latest_on_empty_or_dead_manifest(tmp_path):
+    db = str(tmp_path / "manifest.sqlite")
+    assert run_manifest.latest(path=db) is None
+    path = make_result(tmp_path, "a")
+    run_manifest.record_result(path, {}, path=db)
+    path.unlink()
+
+    assert run_manifest.latest(path=db) is None
+    assert run_manifest.stats(path=db)["runs"] == 0
+
+
+def test_record_result_upserts_one_row_per_path(tmp_path):
+    db = str(tmp_path / "manifest.sqlite")
+    path = make_result(tmp_path, "a")
+    run_manifest.record_result(path, {"ats_score": 70}, written_at=1, path=db)
+    run_manifest.record_result(path, {"ats_score": 81.5}, written_at=2, path=db)
+
+    rows = run_manifest._query("SELECT * FROM runs", path=db)
+    assert len(rows) == 1
+    assert rows[0]["ats_score"] == "81.5" and rows[0]["run_folder"] == "a"
+    assert run_manifest.has_result(path, path=db)
+
+
+def test_since_filters_by_date_and_skips_missing_files(tmp_path):
+    db = str(tmp_path / "manifest.sqlite")
+    for name, date in [("old", "2025-08-01"), ("new", "2025-09-20"), ("gone", "2025-09-21")]:
+        run_manifest.record_result(make_result(tmp_path, name, date), {"company": name, "date": date}, path=db)
+    (tmp_path / "runs" / "gone" / "outputs" / "result.json").unlink()
+
+    assert [r["company"] for r in run_manifest.since("2025-09-01", path=db)] == ["new"]
+
+
+def test_reconcile_adds_only_runs_missing_from_manifest(tmp_path):
+    db = str(tmp_path / "manifest.sqlite")
+    runs = tmp_path / "runs"
+    kept = make_result(tmp_path, "a")
+    run_manifest.record_result(kept, {"company": "indexed"}, written_at=5, path=db)
+    make_result(tmp_path, "b")
+    (runs / "c" / "outputs").mkdir(parents=True)
+    (runs / "c" / "outputs" / "result.json").write_text("{", encoding="utf-8")
+
+    assert run_manifest.reconcile(str(runs), path=db) == 1
+    assert run_manifest.reconcile(str(runs), path=db) == 0
+    rows = {r["run_folder"]: r for r in run_manifest._query("SELECT * FROM runs", path=db)}
+    assert sorted(rows) == ["a", "b"]
+    assert rows["a"]["company"] == "indexed" and rows["a"]["written_at"] == 5
+
+
+def test_rebuild_prunes_dead_rows_and_reindexes(tmp_path):
+    db = str(tmp_path / "manifest.sqlite")
+    dead = make_result(tmp_path, "dead")
+    run_manifest.record_result(dead, {}, path=db)
+    dead.unlink()
+    make_result(tmp_path, "a")
+
+    assert run_manifest.rebuild(str(tmp_path / "runs"), path=db) == 1
+    assert [r["run_folder"] for r in run_manifest._query("SELECT run_folder FROM runs", path=db)] == ["a"]
@@ -0,0 +1,70 @@
+import json
+
+import sheet_outbox
+from fake_sheets import FakeSheetsService
+
+
+def make_run(root, name, **fields):
+    out = root / "runs" / name / "outputs"
+    out.mkdir(parents=True)
+    result = {"date": "2025-09-17", "company": name, "job_title": "Analyst",
+              "jd_path": f"runs/{name}/inputs/jd.md", "ats_score": "fallback", **fields}
+    (out / "result.json").write_text(json.dumps(result), encoding="utf-8")
+    return result
+
+
+def test_two_syncs_append_each_row_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for name in ("a", "b", "c"):
+        make_run(tmp_path, name)
+    db = str(tmp_path / "runs" / "manifest.sqlite")
+    service = FakeSheetsService()
+
+    first = sheet_outbox.sync(service, "sheet", path=db)
+    second = sheet_outbox.sync(service, "sheet", path=db)
+
+    assert first["sent"] == 3 and second["sent"] == 0
+    assert sorted(r[1] for r in service.rows) == ["a", "b", "c"]
+
+
+def test_fresh_outbox_skips_rows_already_in_sheet(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    old = sheet_outbox.result_row(make_run(tmp_path, "old"))
+    make_run(tmp_path, "new")
+    service = FakeSheetsService(rows=[["Date", "Company"], old])
+
+    stats = sheet_outbox.sync(service, "sheet", path=str(tmp_path / "runs" / "manifest.sqlite"))
+
+    assert stats["seeded"] == 1 and stats["sent"] == 1
+    assert [r[1] for r in service.rows] == ["Company", "old", "new"]
+
+
+def test_changed_result_is_not_appended_again(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    make_run(tmp_path, "a")
+    db = str(tmp_path / "runs" / "manifest.sqlite")
+    service = FakeSheetsService()
+    sheet_outbox.sync(service, "sheet", path=db)
+
+    path = tmp_path / "runs" / "a" / "outputs" / "result.json"
+    result = json.loads(path.read_text(encoding="utf-8"))
+    path.write_text(json.dumps({**result, "ats_score": 81.5}), encoding="utf-8")
+    sheet_outbox.sync(service, "sheet", path=db)
+
+    assert len(service.rows) == 1
+
+
+def test_committed_runs_missing_from_manifest_are_queued(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db = str(tmp_path / "runs" / "manifest.sqlite")
+    make_run(tmp_path, "new")
+    sheet_outbox.run_manifest.record_result("runs/new/outputs/result.json",
+                                            {"company": "new"}, path=db)
+    for name in ("old1", "old2"):
+        make_run(tmp_path, name)
+    service = FakeSheetsService()
+
+    stats = sheet_outbox.sync(service, "sheet", path=db)
+
+    assert stats["sent"] == 3
+    assert sorted(r[1] for r in service.rows) == ["new", "old1", "old2"]
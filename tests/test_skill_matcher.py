@@ -0,0 +1,25 @@
+from skill_matcher import SkillMatcher
+
+
+SKILLS = ["Power BI", "Pivot Tables", "Data Visualization", "SQL", "Statistical Modeling"]
+
+
+def test_multi_word_and_variant_spellings():
+    m = SkillMatcher(SKILLS)
+    text = "Built power-bi reports, a pivot table or two and statistical modelling in SQL; data visualisation."
+    assert m.matched(text) == SKILLS
+
+
+def test_words_must_be_adjacent():
+    m = SkillMatcher(SKILLS)
+    assert m.matched("Power users of BI tools; pivot the data into tables") == []
+
+
+def test_punctuation_between_words_still_matches():
+    m = SkillMatcher(SKILLS)
+    assert m.matched("Power. BI and pivot, tables") == ["Power BI", "Pivot Tables"]
+
+
+def test_synonyms():
+    m = SkillMatcher(["Power BI", "Machine Learning"], {"power bi": ["powerbi"], "machine learning": ["ml"]})
+    assert m.score("PowerBI and ML") == 100.0